@@ -343,7 +343,7 @@ def init(
         db.init_database()
         console.print("[bold green]Base de données initialisée avec succès ![/bold green]")
     except DatabaseNotFoundError as e:
-        db_name = db._get_database_name()
+        db_name = db._database_name
         console.print(f"[yellow]{e}[/yellow]")
         console.print()
 
@@ -352,9 +352,7 @@ def init(
                 db.create_database()
                 console.print(f"[green]Base de données '{db_name}' créée[/green]")
 
-                # Reset the engine for the new database
-                db.close()
-                db = DatabaseManager(settings)
+                # The engine now reaches the new database: retry with it
                 db.init_database()
                 console.print("[bold green]Base de données initialisée avec succès ![/bold green]")
             except Exception as create_error:
@@ -20,8 +20,15 @@ from rich.text import Text
 
 console = Console()
 
+# Keyboard reader used by every widget (single swap point for tests)
+_readkey = readchar.readkey
+
 T = TypeVar("T")
 
+# 'r' for return (works everywhere)
+# ESC (0x1B) as an alternative (does not work in all IDEs)
+_CANCEL_KEYS = frozenset(("r", "\x1b"))
+
 
 def _is_cancel_key(key: str) -> bool:
     """Check if the key is a cancel key (r or Escape).
@@ -35,12 +42,10 @@ def _is_cancel_key(key: str) -> bool:
     Returns:
         True if it is a cancel key.
     """
-    # 'r' for return (works everywhere)
-    # ESC (0x1B) as an alternative (does not work in all IDEs)
-    return key == "r" or key == "\x1b"
+    return key in _CANCEL_KEYS
 
 
-@dataclass
+@dataclass(slots=True)
 class CheckboxItem:
     """An item in the selection list."""
 
@@ -53,6 +58,8 @@ class CheckboxItem:
 class CheckboxResult:
     """Result of a checkbox selection."""
 
+    __slots__ = ("cancelled", "items")
+
     def __init__(self, items: list[CheckboxItem], cancelled: bool = False) -> None:
         self.items = items
         self.cancelled = cancelled
@@ -142,7 +149,7 @@ def checkbox_select(
 
     with Live(render(), console=console, refresh_per_second=10, transient=True) as live:
         while True:
-            key = readchar.readkey()
+            key = _readkey()
 
             if key == readchar.key.UP or key == "k":
                 cursor_pos = (cursor_pos - 1) % len(items)
@@ -173,7 +180,7 @@ def checkbox_select(
     return CheckboxResult(items, cancelled)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SelectItem:
     """An item in the single selection list."""
 
@@ -185,6 +192,8 @@ class SelectItem:
 class SelectResult:
     """Result of a single selection."""
 
+    __slots__ = ("cancelled", "item")
+
     def __init__(self, item: SelectItem | None = None, cancelled: bool = False) -> None:
         self.item = item
         self.cancelled = cancelled
@@ -269,7 +278,7 @@ def select_single(
 
     with Live(render(), console=console, refresh_per_second=10, transient=True) as live:
         while True:
-            key = readchar.readkey()
+            key = _readkey()
 
             if key == readchar.key.UP or key == "k":
                 cursor_pos = (cursor_pos - 1) % len(items)
@@ -436,7 +445,7 @@ def select_editions(
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class MenuOption:
     """A menu option."""
 
@@ -448,6 +457,8 @@ class MenuOption:
 class MenuResult:
     """Result of a menu selection."""
 
+    __slots__ = ("cancelled", "key")
+
     def __init__(self, key: str | None = None, cancelled: bool = False) -> None:
         self.key = key
         self.cancelled = cancelled
@@ -526,7 +537,7 @@ def select_menu(
 
     with Live(render(), console=console, refresh_per_second=10, transient=True) as live:
         while True:
-            key = readchar.readkey()
+            key = _readkey()
 
             if key == readchar.key.UP or key == "k":
                 cursor_pos = (cursor_pos - 1) % len(all_options)
@@ -554,7 +565,7 @@ def select_menu(
     return MenuResult(key=selected_key)
 
 
-@dataclass
+@dataclass(slots=True)
 class ToggleItem:
     """An item with on/off state."""
 
@@ -567,6 +578,8 @@ class ToggleItem:
 class ToggleListResult:
     """Result of a toggle list."""
 
+    __slots__ = ("action", "cancelled", "items")
+
     def __init__(
         self,
         items: list[ToggleItem],
@@ -659,7 +672,7 @@ def select_toggle_list(
 
     with Live(render(), console=console, refresh_per_second=10, transient=True) as live:
         while True:
-            key = readchar.readkey()
+            key = _readkey()
 
             if key == readchar.key.UP or key == "k":
                 cursor_pos = (cursor_pos - 1) % len(items)
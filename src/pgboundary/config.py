@@ -66,6 +66,39 @@ class Settings(BaseSettings):
         description="Version d'Admin Express à utiliser",
     )
 
+    db_pool_class: Literal["queue", "null", "static"] = Field(
+        default="queue",
+        description="Type de pool SQLAlchemy (null : aucune connexion conservée)",
+    )
+
+    db_pgbouncer: bool = Field(
+        default=False,
+        description="Passage par PgBouncer (mode transaction) : ni pool, ni requêtes préparées",
+    )
+
+    db_pool_size: int = Field(
+        default=5,
+        ge=1,
+        description="Nombre de connexions maintenues dans le pool",
+    )
+
+    db_max_overflow: int = Field(
+        default=10,
+        ge=0,
+        description="Connexions supplémentaires autorisées au-delà du pool",
+    )
+
+    db_pool_recycle: int = Field(
+        default=1800,
+        ge=-1,
+        description="Durée de vie maximale d'une connexion en secondes (-1 : illimitée)",
+    )
+
+    db_pool_pre_ping: bool = Field(
+        default=True,
+        description="Vérifier chaque connexion avant de la réutiliser",
+    )
+
     _schema_config: SchemaConfig | None = None
 
     @field_validator("data_dir", "config_file", "catalog_db", mode="before")
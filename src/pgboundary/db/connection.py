@@ -1,25 +1,78 @@
 """PostgreSQL/PostGIS database connection management."""
 
+import importlib.util
 import logging
+import threading
 from collections.abc import Iterator
-from contextlib import contextmanager
-from typing import TYPE_CHECKING
+from contextlib import ExitStack, contextmanager
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, ClassVar
 
-from sqlalchemy import create_engine, text
+from sqlalchemy import URL, create_engine, make_url, text
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, Pool, QueuePool, StaticPool
 
 from pgboundary.config import Settings
 from pgboundary.db.models import TableFactory
 from pgboundary.exceptions import ConnectionError, DatabaseNotFoundError, SchemaError
 
 if TYPE_CHECKING:
-    from sqlalchemy.engine import Engine
+    from sqlalchemy.engine import Connection, Engine
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+    from pgboundary.schema_config import SchemaConfig
 
 logger = logging.getLogger(__name__)
 
+_POOL_CLASSES: dict[str, type[Pool]] = {
+    "queue": QueuePool,
+    "null": NullPool,
+    "static": StaticPool,
+}
+
+# Pilotes synchrones remplacés par psycopg 3 pour le moteur asyncio
+_SYNC_DRIVERNAMES = frozenset(("postgresql", "postgresql+psycopg2"))
+
+# Requêtes statiques, construites une seule fois
+_SELECT_1 = text("SELECT 1")
+_POSTGIS_VERSION = text("SELECT PostGIS_Version()")
+_DATABASE_EXISTS = text("SELECT 1 FROM pg_database WHERE datname = :dbname")
+
+# SQLSTATE invalid_catalog_name : la base de données n'existe pas
+_INVALID_CATALOG_NAME = "3D000"
+
+
+def _is_missing_database(error: Exception) -> bool:
+    """Tell whether a connection error means the database does not exist.
+
+    Relies on the SQLSTATE of the underlying DBAPI error (``sqlstate`` for
+    psycopg 3, ``pgcode`` for psycopg2). psycopg2 leaves it unset for errors
+    raised while connecting, in which case the server message is matched.
+    """
+    orig = getattr(error, "orig", None)
+    sqlstate = getattr(orig, "sqlstate", None) or getattr(orig, "pgcode", None)
+    if sqlstate is not None:
+        return bool(sqlstate == _INVALID_CATALOG_NAME)
+    error_msg = str(error).lower()
+    return "does not exist" in error_msg or "n'existe pas" in error_msg
+
 
 class DatabaseManager:
-    """Connection manager for the PostgreSQL/PostGIS database."""
+    """Connection manager for the PostgreSQL/PostGIS database.
+
+    Engines are shared process-wide: managers with the same URL and pool
+    options reuse a single engine (and its connection pool), which is disposed
+    of when the last of them is closed. Lazy attributes are initialized once
+    even when first accessed from several threads.
+    """
+
+    _engines: ClassVar[dict[tuple[Any, ...], "Engine"]] = {}
+    # Nombre de managers utilisant chaque engine partagé
+    _engine_refs: ClassVar[dict[tuple[Any, ...], int]] = {}
+    _engines_lock: ClassVar[threading.Lock] = threading.Lock()
+    # Dernière TableFactory construite, partagée tant que la configuration est le même objet
+    _shared_table_factory: ClassVar[tuple["SchemaConfig", TableFactory] | None] = None
+    _table_factory_lock: ClassVar[threading.Lock] = threading.Lock()
 
     def __init__(self, settings: Settings | None = None) -> None:
         """Initialize the database manager.
@@ -29,35 +82,141 @@ class DatabaseManager:
         """
         self.settings = settings or Settings()
         self._engine: Engine | None = None
+        self._engine_key: tuple[Any, ...] | None = None
         self._session_factory: sessionmaker[Session] | None = None
         self._table_factory: TableFactory | None = None
+        self._async_engine: AsyncEngine | None = None
+        self._init_lock = threading.Lock()
 
     @property
     def engine(self) -> "Engine":
         """Return the SQLAlchemy engine, creating it if necessary."""
         if self._engine is None:
-            self._engine = create_engine(
-                str(self.settings.database_url),
-                pool_pre_ping=True,
-                pool_size=5,
-                max_overflow=10,
-            )
+            url = self._url
+            options = self._engine_options(url, QueuePool)
+            # repr() : connect_args est un dict, non hachable
+            key = (url, repr(sorted(options.items())))
+            with self._engines_lock:
+                # Revérifié sous le verrou : une seule référence par manager
+                if self._engine is None:
+                    engine = self._engines.get(key)
+                    if engine is None:
+                        engine = create_engine(url, **options)
+                        self._engines[key] = engine
+                    self._engine_refs[key] = self._engine_refs.get(key, 0) + 1
+                    self._engine_key = key
+                    self._engine = engine
         return self._engine
 
+    def _engine_options(self, url: URL, queue_pool: type[Pool]) -> dict[str, Any]:
+        """Build the options passed to the engine from the settings.
+
+        In PgBouncer mode pooling is left to PgBouncer (``NullPool``) and
+        psycopg 3 server-side prepared statements are disabled, as they do not
+        survive transaction pooling.
+
+        Args:
+            url: Database URL, used to detect the driver.
+            queue_pool: Pool class used for the ``queue`` pool type.
+        """
+        pool_class = "null" if self.settings.db_pgbouncer else self.settings.db_pool_class
+        options: dict[str, Any] = {
+            "poolclass": queue_pool if pool_class == "queue" else _POOL_CLASSES[pool_class],
+            "pool_pre_ping": self.settings.db_pool_pre_ping,
+            "pool_recycle": self.settings.db_pool_recycle,
+        }
+        if pool_class == "queue":
+            # Seul QueuePool accepte un dimensionnement. En LIFO, les connexions
+            # inactives en excès restent au fond de la file et expirent.
+            options["pool_size"] = self.settings.db_pool_size
+            options["max_overflow"] = self.settings.db_max_overflow
+            options["pool_use_lifo"] = True
+        if self.settings.db_pgbouncer and url.get_driver_name() == "psycopg":
+            options["connect_args"] = {"prepare_threshold": None}
+        return options
+
+    @property
+    def async_engine(self) -> "AsyncEngine":
+        """Return the asyncio engine, creating it if necessary.
+
+        Uses the psycopg 3 driver unless the URL names an async driver. Unlike
+        the sync engine it is owned by this manager: release it with
+        ``aclose()`` from the event loop that used it.
+
+        Raises:
+            ConnectionError: If SQLAlchemy asyncio support is not installed.
+        """
+        if self._async_engine is None:
+            with self._init_lock:
+                if self._async_engine is None:
+                    # sqlalchemy.ext.asyncio s'importe sans greenlet, qui ne
+                    # manquerait qu'à la première connexion
+                    if importlib.util.find_spec("greenlet") is None:
+                        raise ConnectionError(
+                            "Le support asyncio de SQLAlchemy est requis. "
+                            "Installez-le avec: pip install pgboundary[async]"
+                        )
+                    from sqlalchemy.ext.asyncio import create_async_engine
+
+                    url = self._url
+                    if url.drivername in _SYNC_DRIVERNAMES:
+                        url = url.set(drivername="postgresql+psycopg")
+                    self._async_engine = create_async_engine(
+                        url, **self._engine_options(url, AsyncAdaptedQueuePool)
+                    )
+        return self._async_engine
+
+    async def aclose(self) -> None:
+        """Dispose of the asyncio engine, if it was created."""
+        if self._async_engine is not None:
+            await self._async_engine.dispose()
+            self._async_engine = None
+
+    @classmethod
+    def dispose_all(cls) -> None:
+        """Dispose of every shared engine and empty the registry."""
+        with cls._engines_lock:
+            engines = list(cls._engines.values())
+            cls._engines.clear()
+            cls._engine_refs.clear()
+        for engine in engines:
+            engine.dispose()
+
     @property
     def session_factory(self) -> sessionmaker[Session]:
         """Return the session factory."""
         if self._session_factory is None:
-            self._session_factory = sessionmaker(bind=self.engine, expire_on_commit=False)
+            with self._init_lock:
+                if self._session_factory is None:
+                    self._session_factory = sessionmaker(bind=self.engine, expire_on_commit=False)
         return self._session_factory
 
     @property
     def table_factory(self) -> TableFactory:
-        """Return the table factory."""
+        """Return the table factory.
+
+        Managers whose settings hold the same schema configuration object share
+        one factory (and its MetaData). Only the most recent one is kept, keyed
+        on identity since ``SchemaConfig`` is mutable and unhashable.
+        """
         if self._table_factory is None:
-            self._table_factory = TableFactory(self.settings.schema_config)
+            with self._init_lock:
+                if self._table_factory is None:
+                    self._table_factory = self._get_shared_table_factory(
+                        self.settings.schema_config
+                    )
         return self._table_factory
 
+    @classmethod
+    def _get_shared_table_factory(cls, config: "SchemaConfig") -> TableFactory:
+        """Return the shared factory for ``config``, replacing it if needed."""
+        with cls._table_factory_lock:
+            shared = cls._shared_table_factory
+            if shared is None or shared[0] is not config:
+                shared = (config, TableFactory(config))
+                cls._shared_table_factory = shared
+            return shared[1]
+
     @contextmanager
     def session(self) -> Iterator[Session]:
         """Context manager for database sessions.
@@ -89,42 +248,60 @@ class DatabaseManager:
             DatabaseNotFoundError: If the database does not exist.
             ConnectionError: If the connection fails for another reason.
         """
-        try:
-            with self.engine.connect() as conn:
-                conn.execute(text("SELECT 1"))
-            logger.info("Connexion à la base de données établie")
+        with self._checked_connection():
             return True
-        except Exception as e:
-            error_msg = str(e).lower()
-            # Détection des erreurs "database does not exist"
-            if "does not exist" in error_msg or "n'existe pas" in error_msg:
-                db_name = self._get_database_name()
-                raise DatabaseNotFoundError(f"La base de données '{db_name}' n'existe pas") from e
-            raise ConnectionError(f"Impossible de se connecter à la base de données: {e}") from e
-
-    def _get_database_name(self) -> str:
-        """Extract the database name from the URL.
-
-        Returns:
-            Database name.
-        """
-        from urllib.parse import urlparse
 
-        parsed = urlparse(str(self.settings.database_url))
-        return parsed.path.lstrip("/") or "unknown"
+    @contextmanager
+    def _checked_connection(self) -> Iterator["Connection"]:
+        """Open a connection and check it with ``SELECT 1``.
 
-    def _get_admin_url(self) -> str:
-        """Return the connection URL to the postgres (admin) database.
+        Only errors raised while connecting are translated; errors raised by
+        the caller's block propagate unchanged.
 
-        Returns:
-            Connection URL to the postgres database.
+        Raises:
+            DatabaseNotFoundError: If the database does not exist.
+            ConnectionError: If the connection fails for another reason.
         """
-        from urllib.parse import urlparse, urlunparse
+        with ExitStack() as stack:
+            try:
+                conn = stack.enter_context(self.engine.connect())
+                conn.execute(_SELECT_1)
+            except Exception as e:
+                if _is_missing_database(e):
+                    db_name = self._database_name
+                    raise DatabaseNotFoundError(
+                        f"La base de données '{db_name}' n'existe pas"
+                    ) from e
+                raise ConnectionError(
+                    f"Impossible de se connecter à la base de données: {e}"
+                ) from e
+            logger.info("Connexion à la base de données établie")
+            yield conn
 
-        parsed = urlparse(str(self.settings.database_url))
+    @contextmanager
+    def _connect(self, conn: "Connection | None") -> Iterator["Connection"]:
+        """Yield ``conn`` if given, otherwise a new connection closed on exit."""
+        if conn is not None:
+            yield conn
+            return
+        with self.engine.connect() as new_conn:
+            yield new_conn
+
+    @cached_property
+    def _url(self) -> URL:
+        """Database URL, parsed once per manager."""
+        return make_url(str(self.settings.database_url))
+
+    @cached_property
+    def _database_name(self) -> str:
+        """Database name extracted from the URL (computed once per manager)."""
+        return self._url.database or "unknown"
+
+    @cached_property
+    def _admin_url(self) -> str:
+        """Connection URL to the postgres (admin) database (computed once per manager)."""
         # Remplacer le nom de la base par 'postgres'
-        admin_parsed = parsed._replace(path="/postgres")
-        return urlunparse(admin_parsed)
+        return self._url.set(database="postgres").render_as_string(hide_password=False)
 
     def database_exists(self) -> bool:
         """Check if the database exists.
@@ -132,16 +309,13 @@ class DatabaseManager:
         Returns:
             True if the database exists, False otherwise.
         """
-        db_name = self._get_database_name()
-        admin_url = self._get_admin_url()
+        db_name = self._database_name
+        admin_url = self._admin_url
 
         try:
             admin_engine = create_engine(admin_url, isolation_level="AUTOCOMMIT")
             with admin_engine.connect() as conn:
-                result = conn.execute(
-                    text("SELECT 1 FROM pg_database WHERE datname = :dbname"),
-                    {"dbname": db_name},
-                )
+                result = conn.execute(_DATABASE_EXISTS, {"dbname": db_name})
                 exists = result.scalar() is not None
             admin_engine.dispose()
             return exists
@@ -155,17 +329,14 @@ class DatabaseManager:
         Raises:
             SchemaError: If the creation fails.
         """
-        db_name = self._get_database_name()
-        admin_url = self._get_admin_url()
+        db_name = self._database_name
+        admin_url = self._admin_url
 
         try:
             admin_engine = create_engine(admin_url, isolation_level="AUTOCOMMIT")
             with admin_engine.connect() as conn:
                 # Vérifier que la base n'existe pas déjà
-                result = conn.execute(
-                    text("SELECT 1 FROM pg_database WHERE datname = :dbname"),
-                    {"dbname": db_name},
-                )
+                result = conn.execute(_DATABASE_EXISTS, {"dbname": db_name})
                 if result.scalar() is not None:
                     logger.info("La base de données '%s' existe déjà", db_name)
                     admin_engine.dispose()
@@ -179,28 +350,34 @@ class DatabaseManager:
         except Exception as e:
             raise SchemaError(f"Impossible de créer la base de données '{db_name}': {e}") from e
 
-    def ensure_extensions(self) -> None:
+    def ensure_extensions(self, conn: "Connection | None" = None) -> None:
         """Create required PostgreSQL extensions if they don't exist.
 
         Creates the PostGIS and pgcrypto extensions.
 
+        Args:
+            conn: Connection to reuse. A new one is opened if not provided.
+
         Raises:
             SchemaError: If the extension creation fails.
         """
         extensions = ["postgis", "pgcrypto"]
 
         try:
-            with self.engine.connect() as conn:
+            with self._connect(conn) as c:
                 for ext in extensions:
-                    conn.execute(text(f"CREATE EXTENSION IF NOT EXISTS {ext}"))
+                    c.execute(text(f"CREATE EXTENSION IF NOT EXISTS {ext}"))
                     logger.info("Extension '%s' disponible", ext)
-                conn.commit()
+                c.commit()
         except Exception as e:
             raise SchemaError(f"Impossible de créer les extensions: {e}") from e
 
-    def check_postgis(self) -> bool:
+    def check_postgis(self, conn: "Connection | None" = None) -> bool:
         """Check that the PostGIS extension is available.
 
+        Args:
+            conn: Connection to reuse. A new one is opened if not provided.
+
         Returns:
             True if PostGIS is installed.
 
@@ -208,17 +385,20 @@ class DatabaseManager:
             SchemaError: If PostGIS is not available.
         """
         try:
-            with self.engine.connect() as conn:
-                result = conn.execute(text("SELECT PostGIS_Version()"))
+            with self._connect(conn) as c:
+                result = c.execute(_POSTGIS_VERSION)
                 version = result.scalar()
                 logger.info("PostGIS version: %s", version)
             return True
         except Exception as e:
             raise SchemaError(f"PostGIS n'est pas disponible: {e}") from e
 
-    def create_schema(self) -> None:
+    def create_schema(self, conn: "Connection | None" = None) -> None:
         """Create the PostgreSQL schema for data (if schema mode).
 
+        Args:
+            conn: Connection to reuse. A new one is opened if not provided.
+
         Raises:
             SchemaError: If a creation error occurs.
         """
@@ -228,9 +408,9 @@ class DatabaseManager:
             return
 
         try:
-            with self.engine.connect() as conn:
-                conn.execute(text(f"CREATE SCHEMA IF NOT EXISTS {schema_name}"))
-                conn.commit()
+            with self._connect(conn) as c:
+                c.execute(text(f"CREATE SCHEMA IF NOT EXISTS {schema_name}"))
+                c.commit()
             logger.info("Schéma '%s' créé ou existant", schema_name)
         except Exception as e:
             raise SchemaError(f"Erreur lors de la création du schéma: {e}") from e
@@ -264,20 +444,37 @@ class DatabaseManager:
     def init_database(self) -> None:
         """Fully initialize the database.
 
-        Checks the connection, creates extensions, schema, and tables.
+        Checks the connection, creates extensions, schema, and tables. The
+        checks, extensions and schema share a single pooled connection.
         """
-        self.check_connection()
-        self.ensure_extensions()
-        self.check_postgis()
-        self.create_schema()
+        with self._checked_connection() as conn:
+            self.ensure_extensions(conn)
+            self.check_postgis(conn)
+            self.create_schema(conn)
         self.create_tables()
         logger.info("Base de données initialisée avec succès")
 
     def close(self) -> None:
-        """Close database connections."""
+        """Close database connections.
+
+        The shared engine is disposed of and removed from the registry once
+        no other manager uses it, so the next manager starts with a fresh pool.
+        """
         if self._engine is not None:
-            self._engine.dispose()
+            engine, key = self._engine, self._engine_key
+            last = False
+            with self._engines_lock:
+                # Après dispose_all(), l'engine n'est plus dans le registre
+                if key is not None and self._engines.get(key) is engine:
+                    self._engine_refs[key] -= 1
+                    last = self._engine_refs[key] == 0
+                    if last:
+                        del self._engines[key]
+                        del self._engine_refs[key]
+            if last:
+                engine.dispose()
             self._engine = None
+            self._engine_key = None
             self._session_factory = None
             self._table_factory = None
             logger.info("Connexions fermées")
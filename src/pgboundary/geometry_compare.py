@@ -19,9 +19,12 @@ from __future__ import annotations
 import hashlib
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
+import shapely
 from shapely.geometry import MultiPolygon, Polygon
 
 from pgboundary.import_config import (
+    DEFAULT_THRESHOLDS,
     SimilarityLevel,
     SimilarityMethod,
     SimilarityResult,
@@ -29,42 +32,57 @@ from pgboundary.import_config import (
 )
 
 if TYPE_CHECKING:
+    import numpy.typing as npt
     from shapely.geometry.base import BaseGeometry
 
 
 def compute_geometry_hash(geom: BaseGeometry) -> str:
-    """Compute the MD5 hash of a geometry's coordinates.
+    """Compute the SHA-256 hash of a geometry's coordinates.
+
+    Used by the ``md5`` similarity method (strict identity). The hash is
+    only compared in memory and never stored, so the digest needs no migration.
 
     Args:
         geom: Geometry to hash.
 
     Returns:
-        Hexadecimal MD5 hash of the coordinates.
+        Hexadecimal SHA-256 hash of the coordinates.
     """
     if geom is None or geom.is_empty:
         return ""
 
-    coords_str = _normalize_coords(geom)
-    return hashlib.md5(coords_str.encode()).hexdigest()
+    # SHA-256 plutôt que MD5 : accéléré matériellement (SHA-NI, ARMv8) via OpenSSL
+    return hashlib.sha256(_normalize_coords(geom)).hexdigest()
+
 
+def _normalize_coords(geom: BaseGeometry, precision: int = 6) -> bytes:
+    """Normalize a geometry's coordinates to bytes.
 
-def _normalize_coords(geom: BaseGeometry, precision: int = 6) -> str:
-    """Normalize a geometry's coordinates to a string.
+    The distinct exterior vertices of a polygon (of every part of a
+    MultiPolygon) are rounded and sorted, so the result does not depend on
+    the ring's start point or orientation. The coordinate buffer is returned
+    as is, with no per-coordinate string formatting. Other geometries use
+    their WKB.
 
     Args:
         geom: Geometry to normalize.
         precision: Number of decimal places.
 
     Returns:
-        String representing the normalized coordinates.
+        Bytes representing the normalized coordinates.
     """
     if isinstance(geom, Polygon | MultiPolygon):
-        coords = []
-        for coord in geom.exterior.coords if isinstance(geom, Polygon) else []:
-            coords.append(f"{coord[0]:.{precision}f},{coord[1]:.{precision}f}")
-        return ";".join(sorted(coords))
-    else:
-        return str(geom.wkt)
+        rings = shapely.get_exterior_ring(shapely.get_parts(geom))
+        # + 0.0 ramène -0.0 (issu de l'arrondi) à 0.0, d'octets différents
+        coords = np.round(shapely.get_coordinates(rings), precision) + 0.0
+        coords = coords[np.lexsort((coords[:, 1], coords[:, 0]))]
+        # Sommets distincts (np.unique(axis=0) est bien plus lent) : le point de
+        # fermeture ne dépend plus du sommet de départ
+        distinct = np.ones(len(coords), dtype=bool)
+        distinct[1:] = np.any(coords[1:] != coords[:-1], axis=1)
+        normalized: bytes = coords[distinct].tobytes()
+        return normalized
+    return bytes(shapely.to_wkb(geom))
 
 
 def compute_jaccard_index(geom1: BaseGeometry, geom2: BaseGeometry) -> float:
@@ -98,6 +116,43 @@ def compute_jaccard_index(geom1: BaseGeometry, geom2: BaseGeometry) -> float:
         return 0.0
 
 
+def compute_jaccard_index_batch(
+    geoms1: npt.ArrayLike,
+    geoms2: npt.ArrayLike,
+) -> npt.NDArray[np.float64]:
+    """Compute the Jaccard index (IoU) of geometry pairs in a single pass.
+
+    Element-wise equivalent of :func:`compute_jaccard_index`: intersections,
+    unions and areas go through Shapely's vectorized functions, so the
+    whole batch crosses into GEOS once instead of once per pair.
+
+    Args:
+        geoms1: First geometries (sequence or array).
+        geoms2: Second geometries, same length as ``geoms1``.
+
+    Returns:
+        Array of Jaccard indices (0.0 to 1.0), 0.0 for missing or empty geometries.
+    """
+    array1 = np.asarray(geoms1, dtype=object)
+    array2 = np.asarray(geoms2, dtype=object)
+
+    try:
+        intersection = shapely.area(shapely.intersection(array1, array2))
+        union = shapely.area(shapely.union(array1, array2))
+    except Exception:
+        # Géométrie invalide dans le lot : repli paire par paire (0.0 pour la fautive)
+        return np.array(
+            [compute_jaccard_index(g1, g2) for g1, g2 in zip(array1, array2, strict=True)],
+            dtype=np.float64,
+        )
+
+    # Aire NaN (géométrie manquante) ou nulle (vide) : union > 0 est faux => 0.0
+    iou: npt.NDArray[np.float64] = np.divide(
+        intersection, union, out=np.zeros(union.shape), where=union > 0
+    )
+    return iou
+
+
 def compute_hausdorff_distance(geom1: BaseGeometry, geom2: BaseGeometry) -> float:
     """Compute the Hausdorff distance between two geometries.
 
@@ -148,7 +203,7 @@ def compute_combined_similarity(
         Detailed comparison result.
     """
     if thresholds is None:
-        thresholds = SimilarityThresholds()
+        thresholds = DEFAULT_THRESHOLDS
 
     # Cas spéciaux
     if geom1 is None or geom2 is None:
@@ -167,7 +222,20 @@ def compute_combined_similarity(
 
     # Étape 1: Calcul IoU
     iou = compute_jaccard_index(geom1, geom2)
+    return _combined_similarity_from_iou(geom1, geom2, iou, thresholds)
+
+
+def _combined_similarity_from_iou(
+    geom1: BaseGeometry,
+    geom2: BaseGeometry,
+    iou: float,
+    thresholds: SimilarityThresholds,
+) -> SimilarityResult:
+    """Classify two non-empty geometries from their already computed IoU.
 
+    Steps 1 to 4 of :func:`compute_combined_similarity`, Hausdorff being
+    computed only when the IoU calls for it.
+    """
     # IoU très élevé => IDENTICAL
     if iou >= thresholds.identical_min:
         return SimilarityResult(
@@ -318,7 +386,7 @@ def compute_similarity(
         Detailed result with level, scores, and explanation.
     """
     if thresholds is None:
-        thresholds = SimilarityThresholds()
+        thresholds = DEFAULT_THRESHOLDS
 
     if method == SimilarityMethod.MD5:
         hash1 = compute_geometry_hash(geom1)
@@ -328,21 +396,18 @@ def compute_similarity(
             level=SimilarityLevel.IDENTICAL if is_identical else SimilarityLevel.DISTINCT,
             iou_score=1.0 if is_identical else 0.0,
             combined_score=1.0 if is_identical else 0.0,
-            reason="Hash MD5 identique" if is_identical else "Hash MD5 différent",
+            reason=(
+                "Hash SHA-256 des coordonnées identique"
+                if is_identical
+                else "Hash SHA-256 des coordonnées différent"
+            ),
         )
 
     elif method == SimilarityMethod.COMBINED:
         return compute_combined_similarity(geom1, geom2, thresholds)
 
     elif method == SimilarityMethod.JACCARD:
-        iou = compute_jaccard_index(geom1, geom2)
-        level = _classify_iou_only(iou, thresholds)
-        return SimilarityResult(
-            level=level,
-            iou_score=iou,
-            combined_score=iou,
-            reason=f"IoU: {iou:.1%}",
-        )
+        return _jaccard_similarity_from_iou(compute_jaccard_index(geom1, geom2), thresholds)
 
     else:  # HAUSDORFF
         hausdorff = compute_hausdorff_distance(geom1, geom2)
@@ -356,6 +421,16 @@ def compute_similarity(
         )
 
 
+def _jaccard_similarity_from_iou(iou: float, thresholds: SimilarityThresholds) -> SimilarityResult:
+    """Build the JACCARD method result from an IoU."""
+    return SimilarityResult(
+        level=_classify_iou_only(iou, thresholds),
+        iou_score=iou,
+        combined_score=iou,
+        reason=f"IoU: {iou:.1%}",
+    )
+
+
 def _classify_iou_only(iou: float, thresholds: SimilarityThresholds) -> SimilarityLevel:
     """Classify by IoU only."""
     if iou >= thresholds.identical_min:
@@ -446,7 +521,7 @@ class GeometryMatcher:
         elif threshold is not None:
             self.thresholds = SimilarityThresholds(identical_min=threshold)
         else:
-            self.thresholds = SimilarityThresholds()
+            self.thresholds = DEFAULT_THRESHOLDS
 
     def compare(self, geom1: BaseGeometry, geom2: BaseGeometry) -> SimilarityResult:
         """Compare two geometries and return the detailed result.
@@ -460,6 +535,31 @@ class GeometryMatcher:
         """
         return compute_similarity(geom1, geom2, self.method, self.thresholds)
 
+    def _compare_pairs(
+        self,
+        geoms1: list[BaseGeometry],
+        geoms2: list[BaseGeometry],
+    ) -> list[SimilarityResult]:
+        """Compare geometry pairs, computing their IoU in a single batch.
+
+        Same results as calling :meth:`compare` on each pair: the IoU-based
+        methods take their scores from :func:`compute_jaccard_index_batch`.
+        """
+        if not geoms1 or self.method not in (SimilarityMethod.COMBINED, SimilarityMethod.JACCARD):
+            return [self.compare(g1, g2) for g1, g2 in zip(geoms1, geoms2, strict=True)]
+
+        ious = compute_jaccard_index_batch(geoms1, geoms2).tolist()
+        results: list[SimilarityResult] = []
+        for g1, g2, iou in zip(geoms1, geoms2, ious, strict=True):
+            if g1.is_empty or g2.is_empty:
+                # Cas spéciaux (géométrie vide) : traités par la comparaison unitaire
+                results.append(self.compare(g1, g2))
+            elif self.method == SimilarityMethod.COMBINED:
+                results.append(_combined_similarity_from_iou(g1, g2, iou, self.thresholds))
+            else:
+                results.append(_jaccard_similarity_from_iou(iou, self.thresholds))
+        return results
+
     def find_matches(
         self,
         old_features: list[dict[str, Any]],
@@ -499,15 +599,30 @@ class GeometryMatcher:
         auto_matches: list[tuple[dict[str, Any], dict[str, Any], SimilarityResult]] = []
         needs_validation: list[tuple[dict[str, Any], dict[str, Any], SimilarityResult]] = []
 
+        # Paires avec géométries des deux côtés, comparées en un seul lot
+        geom_keys = [
+            key
+            for key in common_keys
+            if old_by_key[key].get("geometry") is not None
+            and new_by_key[key].get("geometry") is not None
+        ]
+        geom_results = dict(
+            zip(
+                geom_keys,
+                self._compare_pairs(
+                    [old_by_key[key]["geometry"] for key in geom_keys],
+                    [new_by_key[key]["geometry"] for key in geom_keys],
+                ),
+                strict=True,
+            )
+        )
+
         for key in common_keys:
             old_f = old_by_key[key]
             new_f = new_by_key[key]
 
-            old_geom = old_f.get("geometry")
-            new_geom = new_f.get("geometry")
-
-            if old_geom is not None and new_geom is not None:
-                result = self.compare(old_geom, new_geom)
+            if key in geom_results:
+                result = geom_results[key]
 
                 if result.level == SimilarityLevel.IDENTICAL:
                     # Fusion automatique
@@ -544,7 +659,7 @@ class GeometryMatcher:
         """
         t = self.thresholds
         descriptions = {
-            SimilarityMethod.MD5: "Hash MD5 (identité stricte)",
+            SimilarityMethod.MD5: "Hash SHA-256 des coordonnées (identité stricte)",
             SimilarityMethod.COMBINED: (
                 f"Combiné IoU + Hausdorff: "
                 f"identique >= {t.identical_min:.0%}, "
@@ -15,13 +15,13 @@ from __future__ import annotations
 from dataclasses import dataclass
 from enum import StrEnum
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class SimilarityMethod(StrEnum):
     """Geometric comparison methods for historization."""
 
-    MD5 = "md5"  # Hash MD5 des coordonnées (identité stricte)
+    MD5 = "md5"  # Hash SHA-256 des coordonnées (identité stricte), nom historique conservé
     JACCARD = "jaccard"  # Indice de Jaccard / IoU (superposition spatiale)
     HAUSDORFF = "hausdorff"  # Distance de Hausdorff (ressemblance des formes)
     COMBINED = "combined"  # Combinaison IoU + Hausdorff (recommandé)
@@ -77,8 +77,11 @@ class SimilarityThresholds(BaseModel):
     """Decision matrix thresholds for similarity.
 
     The thresholds define the boundaries between similarity levels.
+    Instances are immutable, so a single default can be shared.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     identical_min: float = Field(
         default=0.95,
         ge=0.0,
@@ -104,6 +107,10 @@ class SimilarityThresholds(BaseModel):
     )
 
 
+# Seuils par défaut, partagés (instance immuable)
+DEFAULT_THRESHOLDS = SimilarityThresholds()
+
+
 class HistorizationConfig(BaseModel):
     """Historization configuration for a product.
 
@@ -158,7 +165,7 @@ class HistorizationConfig(BaseModel):
             Human-readable description.
         """
         if self.method == SimilarityMethod.MD5:
-            return "Comparaison exacte (hash MD5)"
+            return "Comparaison exacte (hash SHA-256 des coordonnées)"
         elif self.method == SimilarityMethod.COMBINED:
             t = self.get_effective_thresholds()
             return (
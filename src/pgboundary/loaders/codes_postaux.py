@@ -21,6 +21,7 @@ from typing import TYPE_CHECKING, Any, Literal
 
 import geopandas as gpd
 import httpx
+from pyproj import CRS
 from shapely.geometry import MultiPolygon, Point, Polygon
 
 from pgboundary.exceptions import LoaderError
@@ -36,6 +37,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# WGS84 CRS built once and shared by every La Poste GeoDataFrame
+_WGS84 = CRS.from_epsg(4326)
+
 
 class CodesPostauxLoader(BaseLoader):
     """Loader for postal code data.
@@ -453,7 +457,7 @@ class CodesPostauxLoader(BaseLoader):
             }
             data.append(record)
 
-        gdf = gpd.GeoDataFrame(data, geometry=geometries, crs="EPSG:4326")
+        gdf = gpd.GeoDataFrame(data, geometry=geometries, crs=_WGS84)
 
         # Supprimer les lignes sans géométrie
         gdf = gdf[gdf.geometry.notna()]
@@ -13,6 +13,9 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_CONFIG_FILENAME = "pgboundary.yml"
 
+# LibYAML-backed loader when available, pure-Python fallback otherwise
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class StorageMode(StrEnum):
     """Table storage mode."""
@@ -610,7 +613,7 @@ def load_config(config_path: Path | None = None) -> SchemaConfig:
     logger.debug("Chargement de la configuration: %s", config_path)
 
     with config_path.open(encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=YAML_LOADER)
 
     if data is None:
         return get_default_config()
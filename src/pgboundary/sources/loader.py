@@ -21,6 +21,7 @@ from pgboundary.products.catalog import (
     ProductCategory,
     TerritoryCode,
 )
+from pgboundary.schema_config import YAML_LOADER
 
 logger = logging.getLogger(__name__)
 
@@ -83,7 +84,7 @@ def load_territory_crs(territories_dir: Path | None = None) -> dict[str, str]:
 
     for yml_path in territories_dir.glob("*.yml"):
         with yml_path.open(encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=YAML_LOADER)
 
         if data and "territories" in data:
             for code, info in data["territories"].items():
@@ -213,7 +214,7 @@ def load_products(sources_dir: Path | None = None) -> list[IGNProduct]:
         for yml_path in sorted(dir_path.glob("**/*.yml")):
             try:
                 with yml_path.open(encoding="utf-8") as f:
-                    data = yaml.safe_load(f)
+                    data = yaml.load(f, Loader=YAML_LOADER)
 
                 if data and "id" in data:
                     product = _parse_product(data)
@@ -3,18 +3,40 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 from unittest.mock import MagicMock, patch
 
-import pytest
-from typer.testing import CliRunner
-
 from pgboundary.cli_catalog import catalog_app
+from pgboundary.products.catalog import IGNProduct
+
+if TYPE_CHECKING:
+    from typer.testing import CliRunner
+
+# Base SQLite du catalogue qui n'existe jamais (seul le catalogue YAML est utilisé)
+_MISSING_CATALOG_DB = Path("/tmp/nonexistent.db")
+
+# Attributs autorisés sur un produit simulé : champs du modèle et méthodes utilisées par la CLI
+_PRODUCT_ATTRS = (*IGNProduct.model_fields, "get_size_formatted")
+
 
+def _make_product(**overrides: Any) -> MagicMock:
+    """Crée un produit simulé restreint aux attributs de IGNProduct.
 
-@pytest.fixture
-def runner() -> CliRunner:
-    """Fixture pour le CliRunner."""
-    return CliRunner()
+    Le ``spec_set`` empêche la création implicite d'attributs : une faute de
+    frappe dans un test lève une ``AttributeError`` au lieu de passer en silence.
+    """
+    product = MagicMock(spec_set=_PRODUCT_ATTRS)
+    product.id = "admin-express-cog"
+    product.name = "Admin Express COG"
+    product.provider = "IGN"
+    product.api_product = "ADMIN-EXPRESS-COG"
+    product.category.value = "administrative"
+    product.formats = []
+    product.territories = []
+    product.last_date = None
+    for name, value in overrides.items():
+        setattr(product, name, value)
+    return product
 
 
 # =============================================================================
@@ -105,21 +127,13 @@ class TestCatalogList:
 
     def test_list_all_products(self, runner: CliRunner) -> None:
         """Test listage de tous les produits."""
-        mock_product = MagicMock()
-        mock_product.id = "admin-express-cog"
-        mock_product.name = "Admin Express COG"
-        mock_product.provider = "IGN"
-        mock_product.api_product = "ADMIN-EXPRESS-COG"
-        mock_product.category.value = "administrative"
-        mock_product.formats = []
-        mock_product.territories = []
-        mock_product.last_date = "2024-01-01"
+        mock_product = _make_product(last_date="2024-01-01")
 
         with (
             patch("pgboundary.cli_catalog.Settings") as mock_settings,
             patch("pgboundary.products.get_default_catalog") as mock_catalog,
         ):
-            mock_settings.return_value.catalog_db = Path("/tmp/nonexistent.db")
+            mock_settings.return_value.catalog_db = _MISSING_CATALOG_DB
             mock_catalog.return_value.list_all.return_value = [mock_product]
 
             result = runner.invoke(catalog_app, ["list"])
@@ -127,21 +141,13 @@ class TestCatalogList:
 
     def test_list_with_category_filter(self, runner: CliRunner) -> None:
         """Test listage avec filtre catégorie."""
-        mock_product = MagicMock()
-        mock_product.id = "admin-express-cog"
-        mock_product.name = "Admin Express COG"
-        mock_product.provider = "IGN"
-        mock_product.api_product = None
-        mock_product.category.value = "administrative"
-        mock_product.formats = []
-        mock_product.territories = []
-        mock_product.last_date = None
+        mock_product = _make_product(api_product=None)
 
         with (
             patch("pgboundary.cli_catalog.Settings") as mock_settings,
             patch("pgboundary.products.get_default_catalog") as mock_catalog,
         ):
-            mock_settings.return_value.catalog_db = Path("/tmp/nonexistent.db")
+            mock_settings.return_value.catalog_db = _MISSING_CATALOG_DB
             mock_catalog.return_value.list_all.return_value = [mock_product]
 
             result = runner.invoke(catalog_app, ["list", "--category", "administrative"])
@@ -153,7 +159,7 @@ class TestCatalogList:
             patch("pgboundary.cli_catalog.Settings") as mock_settings,
             patch("pgboundary.products.get_default_catalog") as mock_catalog,
         ):
-            mock_settings.return_value.catalog_db = Path("/tmp/nonexistent.db")
+            mock_settings.return_value.catalog_db = _MISSING_CATALOG_DB
             mock_catalog.return_value.list_all.return_value = []
 
             result = runner.invoke(catalog_app, ["list"])
@@ -175,21 +181,17 @@ class TestCatalogShow:
 
     def test_show_yaml_product_no_sqlite(self, runner: CliRunner) -> None:
         """Test affichage d'un produit YAML sans SQLite."""
-        mock_product = MagicMock()
-        mock_product.name = "Admin Express COG"
-        mock_product.id = "admin-express-cog"
-        mock_product.provider = "IGN"
-        mock_product.category.value = "administrative"
-        mock_product.api_product = "ADMIN-EXPRESS-COG"
-        mock_product.formats = [MagicMock(value="shp"), MagicMock(value="gpkg")]
-        mock_product.territories = [MagicMock(value="FRA")]
+        mock_product = _make_product(
+            formats=[MagicMock(value="shp"), MagicMock(value="gpkg")],
+            territories=[MagicMock(value="FRA")],
+        )
         mock_product.get_size_formatted.return_value = "500 Mo"
 
         with (
             patch("pgboundary.cli_catalog.Settings") as mock_settings,
             patch("pgboundary.products.get_default_catalog") as mock_catalog,
         ):
-            mock_settings.return_value.catalog_db = Path("/tmp/nonexistent.db")
+            mock_settings.return_value.catalog_db = _MISSING_CATALOG_DB
             mock_catalog.return_value.get.return_value = mock_product
 
             result = runner.invoke(catalog_app, ["show", "admin-express-cog"])
@@ -202,7 +204,7 @@ class TestCatalogShow:
             patch("pgboundary.cli_catalog.Settings") as mock_settings,
             patch("pgboundary.products.get_default_catalog") as mock_catalog,
         ):
-            mock_settings.return_value.catalog_db = Path("/tmp/nonexistent.db")
+            mock_settings.return_value.catalog_db = _MISSING_CATALOG_DB
             mock_catalog.return_value.get.return_value = None
 
             result = runner.invoke(catalog_app, ["show", "UNKNOWN-PRODUCT"])
@@ -5,12 +5,11 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, patch
 
-import pytest
-from typer.testing import CliRunner
-
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from typer.testing import CliRunner
+
 from pgboundary.cli_completion import (
     Shell,
     _detect_shell,
@@ -18,13 +17,6 @@ from pgboundary.cli_completion import (
     completion_app,
 )
 
-
-@pytest.fixture
-def runner() -> CliRunner:
-    """Fixture pour le CliRunner."""
-    return CliRunner()
-
-
 # =============================================================================
 # Tests de _detect_shell
 # =============================================================================
@@ -2,170 +2,115 @@
 
 from __future__ import annotations
 
-import tempfile
+from contextlib import ExitStack, contextmanager
 from pathlib import Path
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
 from unittest.mock import MagicMock, patch
 
 import pytest
-from typer.testing import CliRunner
+import typer
 
+import pgboundary.cli_config
 from pgboundary.cli_config import (
     _format_size,
-    _get_enabled_layers_count,
     _get_product_editions,
     _mask_password,
     config_app,
+    config_info,
+    config_sync_product,
+    config_update,
+    data_remove,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
 
-@pytest.fixture
-def runner() -> CliRunner:
-    """Fixture pour le CliRunner."""
-    return CliRunner()
+    from typer.testing import CliRunner
 
 
-@pytest.fixture
-def temp_config_file() -> Path:
-    """Crée un fichier de configuration temporaire."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as f:
-        f.write("""
-storage:
-  mode: schema
-  schema_name: geo_test
+# Chemin de configuration qui n'existe jamais
+_MISSING_CFG = Path("/tmp/nonexistent_pgboundary.yml")
 
-field_prefixes:
-  code: cd_
-  label: lb_
-  date: dt_
 
-srid: 4326
+@contextmanager
+def _patches(targets: dict[str, dict[str, Any]]) -> Iterator[dict[str, MagicMock]]:
+    """Applique plusieurs ``patch`` dans une seule ``ExitStack``.
 
-imports: {}
-""")
-        f.flush()
-        path = Path(f.name)
-    yield path  # type: ignore[misc]
-    path.unlink(missing_ok=True)
+    Args:
+        targets: Dictionnaire {cible: arguments de ``patch``}.
 
+    Yields:
+        Dictionnaire {cible: mock}.
+    """
+    with ExitStack() as stack:
+        yield {
+            target: stack.enter_context(patch(target, **kwargs))
+            for target, kwargs in targets.items()
+        }
 
-# =============================================================================
-# Tests des fonctions pures
-# =============================================================================
 
+def _use_config_path(monkeypatch: pytest.MonkeyPatch, path: Path) -> Path:
+    """Redirige _get_config_path vers le chemin donné."""
+    monkeypatch.setattr(pgboundary.cli_config, "_get_config_path", lambda: path)
+    return path
 
-class TestGetEnabledLayersCount:
-    """Tests pour _get_enabled_layers_count."""
-
-    def test_no_layers(self) -> None:
-        """Test avec aucune couche."""
-        config: dict = {}
-        enabled, total = _get_enabled_layers_count(config)
-        assert enabled == 0
-        assert total == 0
-
-    def test_empty_layers_dict(self) -> None:
-        """Test avec un dict de couches vide."""
-        config = {"layers": {}}
-        enabled, total = _get_enabled_layers_count(config)
-        assert enabled == 0
-        assert total == 0
-
-    def test_all_enabled(self) -> None:
-        """Test avec toutes les couches activées."""
-        config = {
-            "layers": {
-                "COMMUNE": {"enabled": True},
-                "REGION": {"enabled": True},
-                "DEPARTEMENT": {"enabled": True},
-            }
-        }
-        enabled, total = _get_enabled_layers_count(config)
-        assert enabled == 3
-        assert total == 3
-
-    def test_some_disabled(self) -> None:
-        """Test avec certaines couches désactivées."""
-        config = {
-            "layers": {
-                "COMMUNE": {"enabled": True},
-                "REGION": {"enabled": False},
-                "DEPARTEMENT": {"enabled": True},
-            }
-        }
-        enabled, total = _get_enabled_layers_count(config)
-        assert enabled == 2
-        assert total == 3
-
-    def test_all_disabled(self) -> None:
-        """Test avec toutes les couches désactivées."""
-        config = {
-            "layers": {
-                "COMMUNE": {"enabled": False},
-                "REGION": {"enabled": False},
-            }
-        }
-        enabled, total = _get_enabled_layers_count(config)
-        assert enabled == 0
-        assert total == 2
-
-    def test_default_enabled_when_key_missing(self) -> None:
-        """Test que les couches sans clé 'enabled' sont activées par défaut."""
-        config = {
-            "layers": {
-                "COMMUNE": {},
-                "REGION": {"table_name": "region"},
-            }
-        }
-        enabled, total = _get_enabled_layers_count(config)
-        assert enabled == 2
-        assert total == 2
 
-    def test_legacy_list_structure(self) -> None:
-        """Test avec l'ancienne structure en liste."""
-        config = {"layers": ["COMMUNE", "REGION"]}
-        enabled, total = _get_enabled_layers_count(config)
-        assert enabled == 2
-        assert total == 2
+@pytest.fixture(autouse=True)
+def missing_config(monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Par défaut, le fichier de configuration n'existe pas."""
+    return _use_config_path(monkeypatch, _MISSING_CFG)
+
 
-    def test_legacy_empty_list(self) -> None:
-        """Test avec une liste vide (legacy)."""
-        config = {"layers": []}
-        enabled, total = _get_enabled_layers_count(config)
-        assert enabled == 0
-        assert total == 0
+@pytest.fixture
+def existing_config(monkeypatch: pytest.MonkeyPatch, temp_config_file: Path) -> Path:
+    """Fichier de configuration existant (lecture seule)."""
+    return _use_config_path(monkeypatch, temp_config_file)
 
 
-class TestFormatSize:
-    """Tests pour _format_size."""
+@pytest.fixture
+def loaded_config(
+    monkeypatch: pytest.MonkeyPatch,
+) -> Callable[[dict[str, Any]], SimpleNamespace]:
+    """Fabrique qui fait renvoyer à load_config une configuration avec les imports donnés."""
 
-    def test_none(self) -> None:
-        """Test avec None."""
-        assert _format_size(None) == "?"
+    def _make(imports: dict[str, Any]) -> SimpleNamespace:
+        config = SimpleNamespace(imports=imports)
+        monkeypatch.setattr(pgboundary.cli_config, "load_config", lambda *_args: config)
+        return config
 
-    def test_megabytes(self) -> None:
-        """Test avec des Mo."""
-        assert _format_size(500) == "500 Mo"
+    return _make
 
-    def test_gigabytes(self) -> None:
-        """Test avec des Go."""
-        assert _format_size(2048) == "2.0 Go"
 
-    def test_small_gigabytes(self) -> None:
-        """Test avec juste au-dessus de 1 Go."""
-        assert _format_size(1024) == "1.0 Go"
+@pytest.fixture
+def new_config(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    """Chemin de configuration pas encore créé, dans un répertoire temporaire."""
+    return _use_config_path(monkeypatch, tmp_path / "pgboundary.yml")
 
-    def test_zero(self) -> None:
-        """Test avec 0."""
-        assert _format_size(0) == "0 Mo"
 
-    def test_float_value(self) -> None:
-        """Test avec un float."""
-        assert _format_size(1.5) == "1.5 Mo"
+# =============================================================================
+# Tests des fonctions pures
+# =============================================================================
 
-    def test_large_value(self) -> None:
-        """Test avec une très grande valeur."""
-        result = _format_size(10240)
-        assert "Go" in result
+
+class TestFormatSize:
+    """Tests pour _format_size."""
+
+    @pytest.mark.parametrize(
+        ("size_mb", "expected"),
+        [
+            pytest.param(None, "?", id="none"),
+            pytest.param(500, "500 Mo", id="megabytes"),
+            pytest.param(2048, "2.0 Go", id="gigabytes"),
+            pytest.param(1024, "1.0 Go", id="small_gigabytes"),
+            pytest.param(0, "0 Mo", id="zero"),
+            pytest.param(1.5, "1.5 Mo", id="float_value"),
+            pytest.param(10240, "10.0 Go", id="large_value"),
+        ],
+    )
+    def test_format(self, size_mb: float | None, expected: str) -> None:
+        """Test du formatage de la taille."""
+        assert _format_size(size_mb) == expected
 
 
 class TestGetProductEditions:
@@ -177,27 +122,23 @@ class TestGetProductEditions:
 
     def test_product_without_dates(self) -> None:
         """Test avec un produit sans dates."""
-        product = MagicMock()
-        product.available_dates = None
+        product = SimpleNamespace(available_dates=None)
         assert _get_product_editions(product) is None
 
     def test_product_with_empty_dates(self) -> None:
         """Test avec un produit avec des dates vides."""
-        product = MagicMock()
-        product.available_dates = []
+        product = SimpleNamespace(available_dates=[])
         assert _get_product_editions(product) is None
 
     def test_product_with_dates(self) -> None:
         """Test avec un produit avec des dates."""
-        product = MagicMock()
-        product.available_dates = ["2024-01-01", "2023-06-15"]
+        product = SimpleNamespace(available_dates=["2024-01-01", "2023-06-15"])
         result = _get_product_editions(product)
         assert result == ["2024-01-01", "2023-06-15"]
 
     def test_product_with_year_dates(self) -> None:
         """Test avec des dates au format année."""
-        product = MagicMock()
-        product.available_dates = ["2024", "2023"]
+        product = SimpleNamespace(available_dates=["2024", "2023"])
         result = _get_product_editions(product)
         assert result == ["2024", "2023"]
 
@@ -234,22 +175,13 @@ class TestConfigMain:
 
     def test_config_no_file(self, runner: CliRunner) -> None:
         """Test config sans fichier existant."""
-        with patch(
-            "pgboundary.cli_config._get_config_path",
-            return_value=Path("/tmp/nonexistent_pgboundary.yml"),
-        ):
-            result = runner.invoke(config_app)
-            assert "non trouvé" in result.output or result.exit_code == 0
+        result = runner.invoke(config_app)
+        assert "non trouvé" in result.output or result.exit_code == 0
 
-    def test_config_with_file(self, runner: CliRunner, temp_config_file: Path) -> None:
+    @pytest.mark.usefixtures("existing_config")
+    def test_config_with_file(self, runner: CliRunner) -> None:
         """Test config avec fichier existant."""
-        with (
-            patch(
-                "pgboundary.cli_config._get_config_path",
-                return_value=temp_config_file,
-            ),
-            patch("pgboundary.cli_config.Settings") as mock_settings,
-        ):
+        with patch("pgboundary.cli_config.Settings") as mock_settings:
             mock_settings.return_value.database_url = "postgresql://u:p@h/d"
             mock_settings.return_value.data_dir = Path("/tmp/data")
             result = runner.invoke(config_app)
@@ -259,54 +191,40 @@ class TestConfigMain:
 class TestConfigInfo:
     """Tests pour config_info."""
 
-    def test_info_no_file(self, runner: CliRunner) -> None:
+    def test_info_no_file(self) -> None:
         """Test info sans fichier."""
-        with patch(
-            "pgboundary.cli_config._get_config_path",
-            return_value=Path("/tmp/nonexistent.yml"),
-        ):
-            result = runner.invoke(config_app, ["info"])
-            assert result.exit_code == 1
+        with pytest.raises(typer.Exit) as exc_info:
+            config_info()
+        assert exc_info.value.exit_code == 1
 
-    def test_info_with_file(self, runner: CliRunner, temp_config_file: Path) -> None:
+    @pytest.mark.usefixtures("existing_config")
+    def test_info_with_file(self, runner: CliRunner) -> None:
         """Test info avec fichier existant."""
-        with patch(
-            "pgboundary.cli_config._get_config_path",
-            return_value=temp_config_file,
-        ):
-            result = runner.invoke(config_app, ["info"])
-            assert result.exit_code == 0
+        result = runner.invoke(config_app, ["info"])
+        assert result.exit_code == 0
 
 
 class TestConfigInit:
     """Tests pour config_init."""
 
-    def test_init_existing_file_decline(self, runner: CliRunner, temp_config_file: Path) -> None:
+    @pytest.mark.usefixtures("existing_config")
+    def test_init_existing_file_decline(self, runner: CliRunner) -> None:
         """Test init avec fichier existant et refus de modifier."""
-        with (
-            patch(
-                "pgboundary.cli_config._get_config_path",
-                return_value=temp_config_file,
-            ),
-            patch("pgboundary.cli_config.Confirm.ask", return_value=False),
-        ):
+        with patch("pgboundary.cli_config.Confirm.ask", return_value=False):
             result = runner.invoke(config_app, ["init"])
             assert result.exit_code == 0
 
-    def test_init_force(self, runner: CliRunner, tmp_path: Path) -> None:
+    @pytest.mark.usefixtures("new_config")
+    def test_init_force(self, runner: CliRunner) -> None:
         """Test init avec --force."""
-        config_path = tmp_path / "pgboundary.yml"
-        with (
-            patch(
-                "pgboundary.cli_config._get_config_path",
-                return_value=config_path,
-            ),
-            patch(
-                "pgboundary.cli_config.Prompt.ask",
-                side_effect=["schema", "geo_test", "4326", "/tmp/data"],
-            ),
-            patch("pgboundary.cli_config.Confirm.ask", return_value=False),
-            patch("pgboundary.cli_config.save_config"),
+        with _patches(
+            {
+                "pgboundary.cli_config.Prompt.ask": {
+                    "side_effect": ["schema", "geo_test", "4326", "/tmp/data"]
+                },
+                "pgboundary.cli_config.Confirm.ask": {"return_value": False},
+                "pgboundary.cli_config.save_config": {},
+            }
         ):
             result = runner.invoke(config_app, ["init", "--force"])
             assert result.exit_code == 0
@@ -315,30 +233,23 @@ class TestConfigInit:
 class TestConfigUpdate:
     """Tests pour config_update."""
 
-    def test_update_no_file(self, runner: CliRunner) -> None:
+    def test_update_no_file(self) -> None:
         """Test update sans fichier."""
-        with patch(
-            "pgboundary.cli_config._get_config_path",
-            return_value=Path("/tmp/nonexistent.yml"),
-        ):
-            result = runner.invoke(config_app, ["update"])
-            assert result.exit_code == 1
+        with pytest.raises(typer.Exit) as exc_info:
+            config_update()
+        assert exc_info.value.exit_code == 1
 
-    def test_update_quit_immediately(self, runner: CliRunner, temp_config_file: Path) -> None:
+    @pytest.mark.usefixtures("existing_config")
+    def test_update_quit_immediately(self, runner: CliRunner) -> None:
         """Test update puis quitter immédiatement."""
         mock_menu_result = MagicMock()
         mock_menu_result.cancelled = True
 
-        with (
-            patch(
-                "pgboundary.cli_config._get_config_path",
-                return_value=temp_config_file,
-            ),
-            patch(
-                "pgboundary.cli_widgets.select_menu",
-                return_value=mock_menu_result,
-            ),
-            patch("pgboundary.cli_config.save_config"),
+        with _patches(
+            {
+                "pgboundary.cli_widgets.select_menu": {"return_value": mock_menu_result},
+                "pgboundary.cli_config.save_config": {},
+            }
         ):
             result = runner.invoke(config_app, ["update"])
             assert result.exit_code == 0
@@ -347,23 +258,18 @@ class TestConfigUpdate:
 class TestDataAdd:
     """Tests pour data_add."""
 
-    def test_add_no_config_file(self, runner: CliRunner, tmp_path: Path) -> None:
+    @pytest.mark.usefixtures("new_config")
+    def test_add_no_config_file(self, runner: CliRunner) -> None:
         """Test ajout sans fichier de config (crée un défaut)."""
-        config_path = tmp_path / "pgboundary.yml"
         mock_result = MagicMock()
         mock_result.cancelled = True
         mock_result.value = None
 
-        with (
-            patch(
-                "pgboundary.cli_config._get_config_path",
-                return_value=config_path,
-            ),
-            patch(
-                "pgboundary.cli_widgets.select_single",
-                return_value=mock_result,
-            ),
-            patch("pgboundary.cli_config.save_config"),
+        with _patches(
+            {
+                "pgboundary.cli_widgets.select_single": {"return_value": mock_result},
+                "pgboundary.cli_config.save_config": {},
+            }
         ):
             result = runner.invoke(config_app, ["data", "add"])
             assert result.exit_code == 0
@@ -372,86 +278,59 @@ class TestDataAdd:
 class TestDataRemove:
     """Tests pour data_remove."""
 
-    def test_remove_no_config(self, runner: CliRunner) -> None:
+    def test_remove_no_config(self) -> None:
         """Test suppression sans fichier de config."""
-        with patch(
-            "pgboundary.cli_config._get_config_path",
-            return_value=Path("/tmp/nonexistent.yml"),
-        ):
-            result = runner.invoke(config_app, ["data", "remove"])
-            assert result.exit_code == 1
-
-    def test_remove_product_directly(self, runner: CliRunner, temp_config_file: Path) -> None:
+        with pytest.raises(typer.Exit) as exc_info:
+            data_remove()
+        assert exc_info.value.exit_code == 1
+
+    @pytest.mark.usefixtures("existing_config")
+    def test_remove_product_directly(
+        self, runner: CliRunner, loaded_config: Callable[[dict[str, Any]], SimpleNamespace]
+    ) -> None:
         """Test suppression directe d'un produit."""
-        with (
-            patch(
-                "pgboundary.cli_config._get_config_path",
-                return_value=temp_config_file,
-            ),
-            patch("pgboundary.cli_config.load_config") as mock_load,
-            patch("pgboundary.cli_config.save_config"),
-        ):
-            mock_config = MagicMock()
-            mock_config.imports = {"test-product": {"layers": {}}}
-            mock_load.return_value = mock_config
-
+        loaded_config({"test-product": {"layers": {}}})
+        with patch("pgboundary.cli_config.save_config"):
             result = runner.invoke(config_app, ["data", "remove", "test-product"])
             assert result.exit_code == 0
 
-    def test_remove_product_not_found(self, runner: CliRunner, temp_config_file: Path) -> None:
+    @pytest.mark.usefixtures("existing_config")
+    def test_remove_product_not_found(
+        self, runner: CliRunner, loaded_config: Callable[[dict[str, Any]], SimpleNamespace]
+    ) -> None:
         """Test suppression d'un produit inexistant."""
-        with (
-            patch(
-                "pgboundary.cli_config._get_config_path",
-                return_value=temp_config_file,
-            ),
-            patch("pgboundary.cli_config.load_config") as mock_load,
-        ):
-            mock_config = MagicMock()
-            mock_config.imports = {"other-product": {}}
-            mock_load.return_value = mock_config
-
-            result = runner.invoke(config_app, ["data", "remove", "nonexistent"])
-            assert "non trouvés" in result.output or result.exit_code == 0
-
-    def test_remove_empty_imports(self, runner: CliRunner, temp_config_file: Path) -> None:
+        loaded_config({"other-product": {}})
+        result = runner.invoke(config_app, ["data", "remove", "nonexistent"])
+        assert "non trouvés" in result.output or result.exit_code == 0
+
+    @pytest.mark.usefixtures("existing_config")
+    def test_remove_empty_imports(
+        self, loaded_config: Callable[[dict[str, Any]], SimpleNamespace]
+    ) -> None:
         """Test suppression avec aucun produit configuré."""
-        with (
-            patch(
-                "pgboundary.cli_config._get_config_path",
-                return_value=temp_config_file,
-            ),
-            patch("pgboundary.cli_config.load_config") as mock_load,
-        ):
-            mock_config = MagicMock()
-            mock_config.imports = {}
-            mock_load.return_value = mock_config
-
-            result = runner.invoke(config_app, ["data", "remove"])
-            assert result.exit_code == 0
+        loaded_config({})
+        with pytest.raises(typer.Exit) as exc_info:
+            data_remove()
+        assert exc_info.value.exit_code == 0
 
 
 class TestDataUpdate:
     """Tests pour data_update."""
 
-    def test_update_quit_immediately(self, runner: CliRunner, temp_config_file: Path) -> None:
+    @pytest.mark.usefixtures("existing_config")
+    def test_update_quit_immediately(
+        self, runner: CliRunner, loaded_config: Callable[[dict[str, Any]], SimpleNamespace]
+    ) -> None:
         """Test data update puis quitter immédiatement."""
-        with (
-            patch(
-                "pgboundary.cli_config._get_config_path",
-                return_value=temp_config_file,
-            ),
-            patch("pgboundary.cli_config.load_config") as mock_load,
-            patch(
-                "pgboundary.cli_config.Prompt.ask",
-                return_value="q",
-            ),
-            patch("pgboundary.cli_config.save_config"),
-            patch("pgboundary.cli_config.get_default_catalog") as mock_catalog,
-        ):
-            mock_config = MagicMock()
-            mock_config.imports = {}
-            mock_load.return_value = mock_config
+        loaded_config({})
+        with _patches(
+            {
+                "pgboundary.cli_config.Prompt.ask": {"return_value": "q"},
+                "pgboundary.cli_config.save_config": {},
+                "pgboundary.cli_config.get_default_catalog": {},
+            }
+        ) as mocks:
+            mock_catalog = mocks["pgboundary.cli_config.get_default_catalog"]
             mock_catalog.return_value.__iter__ = MagicMock(return_value=iter([]))
 
             result = runner.invoke(config_app, ["data", "update"])
@@ -461,43 +340,28 @@ class TestDataUpdate:
 class TestConfigSyncProduct:
     """Tests pour config_sync_product."""
 
-    def test_sync_no_config(self, runner: CliRunner) -> None:
+    def test_sync_no_config(self) -> None:
         """Test sync sans fichier de config."""
-        with patch(
-            "pgboundary.cli_config._get_config_path",
-            return_value=Path("/tmp/nonexistent.yml"),
-        ):
-            result = runner.invoke(config_app, ["sync-product"])
-            assert result.exit_code == 1
-
-    def test_sync_empty_imports(self, runner: CliRunner, temp_config_file: Path) -> None:
+        with pytest.raises(typer.Exit) as exc_info:
+            config_sync_product()
+        assert exc_info.value.exit_code == 1
+
+    @pytest.mark.usefixtures("existing_config")
+    def test_sync_empty_imports(
+        self, loaded_config: Callable[[dict[str, Any]], SimpleNamespace]
+    ) -> None:
         """Test sync sans produits configurés."""
-        with (
-            patch(
-                "pgboundary.cli_config._get_config_path",
-                return_value=temp_config_file,
-            ),
-            patch("pgboundary.cli_config.load_config") as mock_load,
-        ):
-            mock_config = MagicMock()
-            mock_config.imports = {}
-            mock_load.return_value = mock_config
-
-            result = runner.invoke(config_app, ["sync-product"])
-            assert result.exit_code == 0
-
-    def test_sync_product_not_found(self, runner: CliRunner, temp_config_file: Path) -> None:
+        loaded_config({})
+        with pytest.raises(typer.Exit) as exc_info:
+            config_sync_product()
+        assert exc_info.value.exit_code == 0
+
+    @pytest.mark.usefixtures("existing_config")
+    def test_sync_product_not_found(
+        self, loaded_config: Callable[[dict[str, Any]], SimpleNamespace]
+    ) -> None:
         """Test sync d'un produit non configuré."""
-        with (
-            patch(
-                "pgboundary.cli_config._get_config_path",
-                return_value=temp_config_file,
-            ),
-            patch("pgboundary.cli_config.load_config") as mock_load,
-        ):
-            mock_config = MagicMock()
-            mock_config.imports = {"other-product": {}}
-            mock_load.return_value = mock_config
-
-            result = runner.invoke(config_app, ["sync-product", "nonexistent"])
-            assert result.exit_code == 1
+        loaded_config({"other-product": {}})
+        with pytest.raises(typer.Exit) as exc_info:
+            config_sync_product("nonexistent")
+        assert exc_info.value.exit_code == 1
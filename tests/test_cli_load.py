@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
+from types import SimpleNamespace
 from typing import Any
 from unittest.mock import MagicMock, patch
 
+import httpx
+import pytest
+
 from pgboundary.cli_load import (
     _check_url,
     _get_effective_layer_config,
     _get_enabled_layer_names,
-    _get_enabled_layers_count,
+    run_import,
+    show_import_selection,
 )
 
 # =============================================================================
@@ -17,111 +22,39 @@ from pgboundary.cli_load import (
 # =============================================================================
 
 
-class TestGetEnabledLayersCount:
-    """Tests pour _get_enabled_layers_count."""
-
-    def test_no_layers_key(self) -> None:
-        """Test sans clé layers."""
-        config: dict[str, Any] = {}
-        enabled, total = _get_enabled_layers_count(config)
-        assert enabled == 0
-        assert total == 0
-
-    def test_empty_layers(self) -> None:
-        """Test avec layers vide."""
-        config: dict[str, Any] = {"layers": {}}
-        enabled, total = _get_enabled_layers_count(config)
-        assert enabled == 0
-        assert total == 0
-
-    def test_all_enabled(self) -> None:
-        """Test avec toutes les couches activées."""
-        config: dict[str, Any] = {
-            "layers": {
-                "COMMUNE": {"enabled": True},
-                "REGION": {"enabled": True},
-            }
-        }
-        enabled, total = _get_enabled_layers_count(config)
-        assert enabled == 2
-        assert total == 2
-
-    def test_mixed(self) -> None:
-        """Test avec un mix activées/désactivées."""
-        config: dict[str, Any] = {
-            "layers": {
-                "COMMUNE": {"enabled": True},
-                "REGION": {"enabled": False},
-                "EPCI": {"enabled": True},
-            }
-        }
-        enabled, total = _get_enabled_layers_count(config)
-        assert enabled == 2
-        assert total == 3
-
-    def test_default_enabled(self) -> None:
-        """Test que sans clé enabled, la couche est activée par défaut."""
-        config: dict[str, Any] = {
-            "layers": {
-                "COMMUNE": {},
-                "REGION": {"table_name": "region"},
-            }
-        }
-        enabled, total = _get_enabled_layers_count(config)
-        assert enabled == 2
-        assert total == 2
-
-
 class TestGetEnabledLayerNames:
     """Tests pour _get_enabled_layer_names."""
 
-    def test_no_layers(self) -> None:
-        """Test sans couches."""
-        config: dict[str, Any] = {}
-        assert _get_enabled_layer_names(config) == []
-
-    def test_empty_layers(self) -> None:
-        """Test avec layers vide."""
-        config: dict[str, Any] = {"layers": {}}
-        assert _get_enabled_layer_names(config) == []
-
-    def test_all_enabled(self) -> None:
-        """Test avec toutes les couches activées."""
-        config: dict[str, Any] = {
-            "layers": {
-                "COMMUNE": {"enabled": True},
-                "REGION": {"enabled": True},
-            }
-        }
-        result = _get_enabled_layer_names(config)
-        assert set(result) == {"COMMUNE", "REGION"}
-
-    def test_some_disabled(self) -> None:
-        """Test avec certaines couches désactivées."""
-        config: dict[str, Any] = {
-            "layers": {
-                "COMMUNE": {"enabled": True},
-                "REGION": {"enabled": False},
-                "EPCI": {"enabled": True},
-            }
-        }
-        result = _get_enabled_layer_names(config)
-        assert set(result) == {"COMMUNE", "EPCI"}
-
-    def test_default_enabled(self) -> None:
-        """Test que les couches sans clé enabled sont activées."""
-        config: dict[str, Any] = {
-            "layers": {
-                "COMMUNE": {},
-            }
-        }
-        assert _get_enabled_layer_names(config) == ["COMMUNE"]
-
-    def test_legacy_list(self) -> None:
-        """Test avec l'ancienne structure en liste."""
-        config: dict[str, Any] = {"layers": ["COMMUNE", "REGION"]}
-        result = _get_enabled_layer_names(config)
-        assert result == ["COMMUNE", "REGION"]
+    @pytest.mark.parametrize(
+        ("config", "expected"),
+        [
+            pytest.param({}, [], id="no_layers"),
+            pytest.param({"layers": {}}, [], id="empty_layers"),
+            pytest.param(
+                {"layers": {"COMMUNE": {"enabled": True}, "REGION": {"enabled": True}}},
+                ["COMMUNE", "REGION"],
+                id="all_enabled",
+            ),
+            pytest.param(
+                {
+                    "layers": {
+                        "COMMUNE": {"enabled": True},
+                        "REGION": {"enabled": False},
+                        "EPCI": {"enabled": True},
+                    }
+                },
+                ["COMMUNE", "EPCI"],
+                id="some_disabled",
+            ),
+            pytest.param({"layers": {"COMMUNE": {}}}, ["COMMUNE"], id="default_enabled"),
+            pytest.param(
+                {"layers": ["COMMUNE", "REGION"]}, ["COMMUNE", "REGION"], id="legacy_list"
+            ),
+        ],
+    )
+    def test_names(self, config: dict[str, Any], expected: list[str]) -> None:
+        """Test des noms de couches activées."""
+        assert _get_enabled_layer_names(config) == expected
 
 
 class TestGetEffectiveLayerConfig:
@@ -221,164 +154,126 @@ class TestGetEffectiveLayerConfig:
 class TestCheckUrl:
     """Tests pour _check_url."""
 
-    def test_url_ok(self) -> None:
-        """Test avec une URL accessible."""
-        mock_client = MagicMock()
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_client.head.return_value = mock_response
-
-        status, message = _check_url(mock_client, "https://example.com")
-        assert status == 200
-        assert message == "OK"
-
-    def test_url_redirect(self) -> None:
-        """Test avec une URL qui redirige (3xx)."""
-        mock_client = MagicMock()
-        mock_response = MagicMock()
-        mock_response.status_code = 301
-        mock_client.head.return_value = mock_response
-
-        status, message = _check_url(mock_client, "https://example.com")
-        assert status == 301
-        assert message == "OK"
-
-    def test_url_not_found(self) -> None:
-        """Test avec une URL 404."""
-        mock_client = MagicMock()
-        mock_response = MagicMock()
-        mock_response.status_code = 404
-        mock_client.head.return_value = mock_response
-
-        status, message = _check_url(mock_client, "https://example.com")
-        assert status == 404
-        assert message == "Erreur"
-
-    def test_url_server_error(self) -> None:
-        """Test avec une erreur serveur."""
+    @pytest.mark.parametrize(
+        ("status_code", "expected_message"),
+        [
+            pytest.param(200, "OK", id="ok"),
+            pytest.param(301, "OK", id="redirect"),
+            pytest.param(404, "Erreur", id="not_found"),
+            pytest.param(500, "Erreur", id="server_error"),
+        ],
+    )
+    def test_url_status(self, status_code: int, expected_message: str) -> None:
+        """Test du message selon le code HTTP de la réponse."""
+        response = SimpleNamespace(status_code=status_code)
+        client = SimpleNamespace(head=lambda _url: response)
+
+        result = _check_url(client, "https://example.com")  # type: ignore[arg-type]
+        assert result == (status_code, expected_message)
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            pytest.param(httpx.ConnectError("Connection refused"), id="connection_error"),
+            pytest.param(httpx.ReadTimeout("Timeout"), id="timeout"),
+        ],
+    )
+    def test_url_request_error(self, error: httpx.RequestError) -> None:
+        """Test avec une erreur de requête (connexion, timeout)."""
         mock_client = MagicMock()
-        mock_response = MagicMock()
-        mock_response.status_code = 500
-        mock_client.head.return_value = mock_response
+        mock_client.head.side_effect = error
 
         status, message = _check_url(mock_client, "https://example.com")
-        assert status == 500
-        assert message == "Erreur"
+        assert status is None
+        assert message == str(error)
 
-    def test_url_connection_error(self) -> None:
-        """Test avec une erreur de connexion."""
-        import httpx
 
-        mock_client = MagicMock()
-        mock_client.head.side_effect = httpx.ConnectError("Connection refused")
+# =============================================================================
+# Tests de run_import
+# =============================================================================
 
-        status, message = _check_url(mock_client, "https://example.com")
-        assert status is None
-        assert "Connection refused" in message
 
-    def test_url_timeout(self) -> None:
-        """Test avec un timeout."""
-        import httpx
+@pytest.fixture(scope="module")
+def catalog_product() -> SimpleNamespace:
+    """Produit du catalogue partagé par les tests de run_import (lecture seule)."""
+    return SimpleNamespace(name="Test Product", last_date="2024-01-01")
 
-        mock_client = MagicMock()
-        mock_client.head.side_effect = httpx.ReadTimeout("Timeout")
 
-        status, _message = _check_url(mock_client, "https://example.com")
-        assert status is None
+@pytest.fixture(scope="module")
+def import_settings() -> SimpleNamespace:
+    """Settings opaques : seulement transmis au ProductLoader mocké."""
+    return SimpleNamespace()
 
 
-# =============================================================================
-# Tests de run_import
-# =============================================================================
+# Configuration d'import d'une couche activée (lecture seule)
+_ENABLED_COMMUNE_CONFIG: dict[str, Any] = {
+    "layers": {"COMMUNE": {"enabled": True}},
+    "territory": "FRA",
+    "format": "shp",
+    "editions": ["2024"],
+}
 
 
 class TestRunImport:
     """Tests pour run_import."""
 
-    def test_unknown_product(self) -> None:
+    def test_unknown_product(self, import_settings: SimpleNamespace) -> None:
         """Test avec un produit inconnu."""
-        from pgboundary.cli_load import run_import
-
         with (
             patch("pgboundary.products.get_default_catalog") as mock_catalog,
             patch("pgboundary.cli_load.console"),
         ):
             mock_catalog.return_value.get.return_value = None
-            settings = MagicMock()
 
-            results = run_import(["unknown-product"], {}, settings)
+            results = run_import(["unknown-product"], {}, import_settings)
             assert results == {}
 
-    def test_no_enabled_layers(self) -> None:
+    def test_no_enabled_layers(
+        self, catalog_product: SimpleNamespace, import_settings: SimpleNamespace
+    ) -> None:
         """Test avec un produit sans couches activées."""
-        from pgboundary.cli_load import run_import
-
         with (
             patch("pgboundary.products.get_default_catalog") as mock_catalog,
             patch("pgboundary.cli_load.console"),
         ):
-            mock_product = MagicMock()
-            mock_catalog.return_value.get.return_value = mock_product
-            settings = MagicMock()
+            mock_catalog.return_value.get.return_value = catalog_product
 
             config = {"layers": {"COMMUNE": {"enabled": False}}}
-            results = run_import(["test-product"], {"test-product": config}, settings)
+            results = run_import(["test-product"], {"test-product": config}, import_settings)
             assert results == {}
 
-    def test_successful_import(self) -> None:
+    def test_successful_import(
+        self, catalog_product: SimpleNamespace, import_settings: SimpleNamespace
+    ) -> None:
         """Test d'un import réussi."""
-        from pgboundary.cli_load import run_import
-
         with (
             patch("pgboundary.products.get_default_catalog") as mock_catalog,
             patch("pgboundary.loaders.product_loader.ProductLoader") as mock_loader_cls,
             patch("pgboundary.cli_load.console"),
         ):
-            mock_product = MagicMock()
-            mock_product.name = "Test Product"
-            mock_product.last_date = "2024-01-01"
-            mock_catalog.return_value.get.return_value = mock_product
-
-            mock_loader = MagicMock()
-            mock_loader.load.return_value = 100
-            mock_loader_cls.return_value = mock_loader
-
-            settings = MagicMock()
-            config = {
-                "layers": {"COMMUNE": {"enabled": True}},
-                "territory": "FRA",
-                "format": "shp",
-                "editions": ["2024"],
-            }
-
-            results = run_import(["test-product"], {"test-product": config}, settings)
+            mock_catalog.return_value.get.return_value = catalog_product
+            mock_loader_cls.return_value.load.return_value = 100
+
+            results = run_import(
+                ["test-product"], {"test-product": _ENABLED_COMMUNE_CONFIG}, import_settings
+            )
             assert results["test-product"] == 100
 
-    def test_import_with_error(self) -> None:
+    def test_import_with_error(
+        self, catalog_product: SimpleNamespace, import_settings: SimpleNamespace
+    ) -> None:
         """Test d'un import avec erreur."""
-        from pgboundary.cli_load import run_import
-
         with (
             patch("pgboundary.products.get_default_catalog") as mock_catalog,
             patch("pgboundary.loaders.product_loader.ProductLoader") as mock_loader_cls,
             patch("pgboundary.cli_load.console"),
         ):
-            mock_product = MagicMock()
-            mock_product.name = "Test Product"
-            mock_product.last_date = None
-            mock_catalog.return_value.get.return_value = mock_product
-
+            mock_catalog.return_value.get.return_value = catalog_product
             mock_loader_cls.side_effect = Exception("Connection error")
 
-            settings = MagicMock()
-            config = {
-                "layers": {"COMMUNE": {"enabled": True}},
-                "territory": "FRA",
-                "format": "shp",
-                "editions": ["2024"],
-            }
-
-            results = run_import(["test-product"], {"test-product": config}, settings)
+            results = run_import(
+                ["test-product"], {"test-product": _ENABLED_COMMUNE_CONFIG}, import_settings
+            )
             assert results["test-product"] == 0
 
 
@@ -392,21 +287,16 @@ class TestShowImportSelection:
 
     def test_empty_imports(self) -> None:
         """Test avec aucun import configuré."""
-        from pgboundary.cli_load import show_import_selection
-
         with patch("pgboundary.cli_load.console"):
             result = show_import_selection({})
             assert result == []
 
     def test_cancelled_selection(self) -> None:
         """Test avec sélection annulée."""
-        from pgboundary.cli_load import show_import_selection
-
-        mock_result = MagicMock()
-        mock_result.cancelled = True
+        cancelled = SimpleNamespace(cancelled=True, enabled_values=[])
 
         with (
-            patch("pgboundary.cli_widgets.select_toggle_list", return_value=mock_result),
+            patch("pgboundary.cli_widgets.select_toggle_list", return_value=cancelled),
             patch("pgboundary.products.get_default_catalog") as mock_catalog,
         ):
             mock_catalog.return_value.get.return_value = None
@@ -10,7 +10,8 @@ Ce module teste les widgets CLI interactifs :
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+from dataclasses import MISSING, FrozenInstanceError, fields, replace
+from typing import TYPE_CHECKING, Any
 
 import pytest
 import readchar
@@ -29,60 +30,71 @@ from pgboundary.cli_widgets import (
     select_territory,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from unittest.mock import MagicMock
 
-class TestIsCancelKey:
-    """Tests pour _is_cancel_key."""
+# Touches de navigation lues une seule fois
+ENTER, UP, DOWN = readchar.key.ENTER, readchar.key.UP, readchar.key.DOWN
+
+# Prototypes des cases à cocher A et B (copiés par test, jamais modifiés)
+_CHECKBOX_A = CheckboxItem(label="A", value="a")
+_CHECKBOX_B = CheckboxItem(label="B", value="b")
+
+
+def _fresh_ab(sel_a: bool = False, sel_b: bool = False) -> list[CheckboxItem]:
+    """Copie modifiable des cases A et B avec l'état de sélection donné."""
+    return [replace(_CHECKBOX_A, selected=sel_a), replace(_CHECKBOX_B, selected=sel_b)]
 
-    def test_escape_char(self) -> None:
-        """Test avec le caractère ESC (0x1B)."""
-        assert _is_cancel_key("\x1b") is True
 
-    def test_r_key(self) -> None:
-        """Test avec la touche 'r' (nouvelle touche de retour)."""
-        assert _is_cancel_key("r") is True
+# Éléments A et B partagés : SelectItem est immuable et select_single ne modifie pas la liste
+_SELECT_AB = (SelectItem(label="A", value="a"), SelectItem(label="B", value="b"))
 
-    def test_other_keys(self) -> None:
-        """Test avec d'autres touches."""
-        assert _is_cancel_key("a") is False
-        assert _is_cancel_key("q") is False
-        assert _is_cancel_key(" ") is False
-        assert _is_cancel_key("\n") is False
-        assert _is_cancel_key("\r") is False
 
-    def test_empty_string(self) -> None:
-        """Test avec chaîne vide."""
-        assert _is_cancel_key("") is False
+def _field_defaults(cls: type) -> dict[str, Any]:
+    """Champs d'une dataclass avec leur valeur par défaut."""
+    return {f.name: f.default for f in fields(cls)}
 
-    def test_control_chars(self) -> None:
-        """Test avec d'autres caractères de contrôle."""
-        assert _is_cancel_key("\x00") is False  # NULL
-        assert _is_cancel_key("\x03") is False  # Ctrl+C
-        assert _is_cancel_key("\x04") is False  # Ctrl+D
+
+# Rich Live est remplacé pour tout le module (fixture partagée de conftest)
+pytestmark = pytest.mark.usefixtures("mock_live")
+
+
+class TestIsCancelKey:
+    """Tests pour _is_cancel_key."""
+
+    @pytest.mark.parametrize(
+        ("key", "expected"),
+        [
+            pytest.param("\x1b", True, id="escape"),
+            pytest.param("r", True, id="r"),
+            pytest.param("a", False, id="a"),
+            pytest.param("q", False, id="q"),
+            pytest.param(" ", False, id="space"),
+            pytest.param("\n", False, id="newline"),
+            pytest.param("\r", False, id="carriage_return"),
+            pytest.param("", False, id="empty"),
+            pytest.param("\x00", False, id="null"),
+            pytest.param("\x03", False, id="ctrl_c"),
+            pytest.param("\x04", False, id="ctrl_d"),
+        ],
+    )
+    def test_is_cancel_key(self, key: str, expected: bool) -> None:
+        """Seuls ESC et 'r' annulent."""
+        assert _is_cancel_key(key) is expected
 
 
 class TestCheckboxItem:
     """Tests pour la dataclass CheckboxItem."""
 
-    def test_default_values(self) -> None:
-        """Test création avec valeurs par défaut."""
-        item = CheckboxItem(label="Test", value="test")
-        assert item.label == "Test"
-        assert item.value == "test"
-        assert item.selected is False
-        assert item.description is None
-
-    def test_full_values(self) -> None:
-        """Test création avec toutes les valeurs."""
-        item = CheckboxItem(
-            label="Test",
-            value="test",
-            selected=True,
-            description="Description",
-        )
-        assert item.label == "Test"
-        assert item.value == "test"
-        assert item.selected is True
-        assert item.description == "Description"
+    def test_dataclass_shape(self) -> None:
+        """Test des champs et de leurs valeurs par défaut."""
+        assert _field_defaults(CheckboxItem) == {
+            "label": MISSING,
+            "value": MISSING,
+            "selected": False,
+            "description": None,
+        }
 
     def test_mutable_selected(self) -> None:
         """Test que selected est mutable."""
@@ -136,17 +148,19 @@ class TestCheckboxResult:
 class TestSelectItem:
     """Tests pour la dataclass SelectItem."""
 
-    def test_default_values(self) -> None:
-        """Test création avec valeurs par défaut."""
-        item = SelectItem(label="Test", value="test")
-        assert item.label == "Test"
-        assert item.value == "test"
-        assert item.description is None
+    def test_dataclass_shape(self) -> None:
+        """Test des champs et de leurs valeurs par défaut."""
+        assert _field_defaults(SelectItem) == {
+            "label": MISSING,
+            "value": MISSING,
+            "description": None,
+        }
 
-    def test_with_description(self) -> None:
-        """Test création avec description."""
-        item = SelectItem(label="Test", value="test", description="Desc")
-        assert item.description == "Desc"
+    def test_frozen(self) -> None:
+        """Test que SelectItem est immuable."""
+        item = SelectItem(label="Test", value="test")
+        with pytest.raises(FrozenInstanceError):
+            item.value = "other"  # type: ignore[misc]
 
 
 class TestSelectResult:
@@ -180,159 +194,86 @@ class TestSelectResult:
 class TestCheckboxSelect:
     """Tests pour checkbox_select avec mocks."""
 
-    @pytest.fixture
-    def mock_live(self) -> MagicMock:
-        """Mock pour Rich Live."""
-        mock = MagicMock()
-        mock.__enter__ = MagicMock(return_value=mock)
-        mock.__exit__ = MagicMock(return_value=False)
-        return mock
-
-    def test_immediate_enter(self, mock_live: MagicMock) -> None:
+    def test_immediate_enter(self, stub_readkey: Callable[..., None]) -> None:
         """Test validation immédiate avec entrée."""
-        items = [
-            CheckboxItem(label="A", value="a", selected=True),
-            CheckboxItem(label="B", value="b"),
-        ]
+        items = _fresh_ab(sel_a=True)
 
-        with (
-            patch("pgboundary.cli_widgets.Live", return_value=mock_live),
-            patch("pgboundary.cli_widgets.readchar.readkey", return_value=readchar.key.ENTER),
-        ):
-            result = checkbox_select(items)
+        stub_readkey(ENTER)
+        result = checkbox_select(items)
 
         assert not result.cancelled
         assert result.selected_values == ["a"]
 
-    def test_escape_cancels(self, mock_live: MagicMock) -> None:
+    def test_escape_cancels(self, stub_readkey: Callable[..., None]) -> None:
         """Test annulation avec Échap."""
         items = [CheckboxItem(label="A", value="a", selected=True)]
 
-        with (
-            patch("pgboundary.cli_widgets.Live", return_value=mock_live),
-            patch("pgboundary.cli_widgets.readchar.readkey", return_value="\x1b"),
-        ):
-            result = checkbox_select(items)
+        stub_readkey("\x1b")
+        result = checkbox_select(items)
 
         assert result.cancelled is True
 
-    def test_space_toggles_selection(self, mock_live: MagicMock) -> None:
+    def test_space_toggles_selection(self, stub_readkey: Callable[..., None]) -> None:
         """Test espace pour cocher/décocher."""
         items = [CheckboxItem(label="A", value="a", selected=False)]
-        keys = [" ", readchar.key.ENTER]
-        key_iter = iter(keys)
-
-        with (
-            patch("pgboundary.cli_widgets.Live", return_value=mock_live),
-            patch("pgboundary.cli_widgets.readchar.readkey", side_effect=lambda: next(key_iter)),
-        ):
-            result = checkbox_select(items)
+        stub_readkey(" ", ENTER)
+        result = checkbox_select(items)
 
         assert items[0].selected is True
         assert result.selected_values == ["a"]
 
-    def test_select_all_with_a(self, mock_live: MagicMock) -> None:
+    def test_select_all_with_a(self, stub_readkey: Callable[..., None]) -> None:
         """Test 'a' pour tout sélectionner."""
-        items = [
-            CheckboxItem(label="A", value="a", selected=False),
-            CheckboxItem(label="B", value="b", selected=False),
-        ]
-        keys = ["a", readchar.key.ENTER]
-        key_iter = iter(keys)
-
-        with (
-            patch("pgboundary.cli_widgets.Live", return_value=mock_live),
-            patch("pgboundary.cli_widgets.readchar.readkey", side_effect=lambda: next(key_iter)),
-        ):
-            result = checkbox_select(items)
+        items = _fresh_ab()
+        stub_readkey("a", ENTER)
+        result = checkbox_select(items)
 
         assert result.selected_values == ["a", "b"]
 
-    def test_deselect_all_with_n(self, mock_live: MagicMock) -> None:
+    def test_deselect_all_with_n(self, stub_readkey: Callable[..., None]) -> None:
         """Test 'n' pour tout désélectionner."""
-        items = [
-            CheckboxItem(label="A", value="a", selected=True),
-            CheckboxItem(label="B", value="b", selected=True),
-        ]
-        keys = ["n", readchar.key.ENTER]
-        key_iter = iter(keys)
-
-        with (
-            patch("pgboundary.cli_widgets.Live", return_value=mock_live),
-            patch("pgboundary.cli_widgets.readchar.readkey", side_effect=lambda: next(key_iter)),
-        ):
-            result = checkbox_select(items, min_selected=0)
+        items = _fresh_ab(sel_a=True, sel_b=True)
+        stub_readkey("n", ENTER)
+        result = checkbox_select(items, min_selected=0)
 
         assert result.selected_values == []
 
-    def test_navigation_up_down(self, mock_live: MagicMock) -> None:
+    def test_navigation_up_down(self, stub_readkey: Callable[..., None]) -> None:
         """Test navigation haut/bas."""
-        items = [
-            CheckboxItem(label="A", value="a"),
-            CheckboxItem(label="B", value="b"),
-        ]
+        items = _fresh_ab()
         # Bas, espace (sélectionner B), entrée
-        keys = [readchar.key.DOWN, " ", readchar.key.ENTER]
-        key_iter = iter(keys)
-
-        with (
-            patch("pgboundary.cli_widgets.Live", return_value=mock_live),
-            patch("pgboundary.cli_widgets.readchar.readkey", side_effect=lambda: next(key_iter)),
-        ):
-            result = checkbox_select(items, min_selected=0)
+        stub_readkey(DOWN, " ", ENTER)
+        result = checkbox_select(items, min_selected=0)
 
         assert items[1].selected is True
         assert result.selected_values == ["b"]
 
-    def test_navigation_j_k(self, mock_live: MagicMock) -> None:
+    def test_navigation_j_k(self, stub_readkey: Callable[..., None]) -> None:
         """Test navigation avec j/k (vim style)."""
-        items = [
-            CheckboxItem(label="A", value="a"),
-            CheckboxItem(label="B", value="b"),
-        ]
+        items = _fresh_ab()
         # j (bas), espace (sélectionner B), k (haut), espace (sélectionner A), entrée
-        keys = ["j", " ", "k", " ", readchar.key.ENTER]
-        key_iter = iter(keys)
-
-        with (
-            patch("pgboundary.cli_widgets.Live", return_value=mock_live),
-            patch("pgboundary.cli_widgets.readchar.readkey", side_effect=lambda: next(key_iter)),
-        ):
-            result = checkbox_select(items, min_selected=0)
+        stub_readkey("j", " ", "k", " ", ENTER)
+        result = checkbox_select(items, min_selected=0)
 
         assert result.selected_values == ["a", "b"]
 
-    def test_wrap_around_navigation(self, mock_live: MagicMock) -> None:
+    def test_wrap_around_navigation(self, stub_readkey: Callable[..., None]) -> None:
         """Test navigation cyclique."""
-        items = [
-            CheckboxItem(label="A", value="a"),
-            CheckboxItem(label="B", value="b"),
-        ]
+        items = _fresh_ab()
         # Haut (cycle vers B), espace, entrée
-        keys = [readchar.key.UP, " ", readchar.key.ENTER]
-        key_iter = iter(keys)
-
-        with (
-            patch("pgboundary.cli_widgets.Live", return_value=mock_live),
-            patch("pgboundary.cli_widgets.readchar.readkey", side_effect=lambda: next(key_iter)),
-        ):
-            checkbox_select(items, min_selected=0)
+        stub_readkey(UP, " ", ENTER)
+        checkbox_select(items, min_selected=0)
 
         assert items[1].selected is True  # B est sélectionné (index 1)
 
-    def test_min_selected_enforcement(self, mock_live: MagicMock) -> None:
+    def test_min_selected_enforcement(
+        self, stub_readkey: Callable[..., None], mock_console: MagicMock
+    ) -> None:
         """Test minimum de sélection requis."""
         items = [CheckboxItem(label="A", value="a", selected=False)]
         # Premier entrée (rejeté car min_selected=1), espace, entrée
-        keys = [readchar.key.ENTER, " ", readchar.key.ENTER]
-        key_iter = iter(keys)
-
-        with (
-            patch("pgboundary.cli_widgets.Live", return_value=mock_live),
-            patch("pgboundary.cli_widgets.readchar.readkey", side_effect=lambda: next(key_iter)),
-            patch("pgboundary.cli_widgets.console") as mock_console,
-        ):
-            result = checkbox_select(items, min_selected=1)
+        stub_readkey(ENTER, " ", ENTER)
+        result = checkbox_select(items, min_selected=1)
 
         # Un message d'avertissement devrait être affiché
         mock_console.print.assert_called()
@@ -342,64 +283,38 @@ class TestCheckboxSelect:
 class TestSelectSingle:
     """Tests pour select_single avec mocks."""
 
-    @pytest.fixture
-    def mock_live(self) -> MagicMock:
-        """Mock pour Rich Live."""
-        mock = MagicMock()
-        mock.__enter__ = MagicMock(return_value=mock)
-        mock.__exit__ = MagicMock(return_value=False)
-        return mock
-
     def test_empty_items(self) -> None:
         """Test avec liste vide."""
         result = select_single([])
         assert result.cancelled is True
 
-    def test_immediate_enter(self, mock_live: MagicMock) -> None:
+    def test_immediate_enter(self, stub_readkey: Callable[..., None]) -> None:
         """Test validation immédiate."""
-        items = [
-            SelectItem(label="A", value="a"),
-            SelectItem(label="B", value="b"),
-        ]
+        items = list(_SELECT_AB)
 
-        with (
-            patch("pgboundary.cli_widgets.Live", return_value=mock_live),
-            patch("pgboundary.cli_widgets.readchar.readkey", return_value=readchar.key.ENTER),
-        ):
-            result = select_single(items)
+        stub_readkey(ENTER)
+        result = select_single(items)
 
         assert result.value == "a"  # Premier élément par défaut
 
-    def test_escape_cancels(self, mock_live: MagicMock) -> None:
+    def test_escape_cancels(self, stub_readkey: Callable[..., None]) -> None:
         """Test annulation avec Échap."""
         items = [SelectItem(label="A", value="a")]
 
-        with (
-            patch("pgboundary.cli_widgets.Live", return_value=mock_live),
-            patch("pgboundary.cli_widgets.readchar.readkey", return_value="\x1b"),
-        ):
-            result = select_single(items)
+        stub_readkey("\x1b")
+        result = select_single(items)
 
         assert result.cancelled is True
 
-    def test_navigation_down(self, mock_live: MagicMock) -> None:
+    def test_navigation_down(self, stub_readkey: Callable[..., None]) -> None:
         """Test navigation vers le bas."""
-        items = [
-            SelectItem(label="A", value="a"),
-            SelectItem(label="B", value="b"),
-        ]
-        keys = [readchar.key.DOWN, readchar.key.ENTER]
-        key_iter = iter(keys)
-
-        with (
-            patch("pgboundary.cli_widgets.Live", return_value=mock_live),
-            patch("pgboundary.cli_widgets.readchar.readkey", side_effect=lambda: next(key_iter)),
-        ):
-            result = select_single(items)
+        items = list(_SELECT_AB)
+        stub_readkey(DOWN, ENTER)
+        result = select_single(items)
 
         assert result.value == "b"
 
-    def test_default_index(self, mock_live: MagicMock) -> None:
+    def test_default_index(self, stub_readkey: Callable[..., None]) -> None:
         """Test index par défaut."""
         items = [
             SelectItem(label="A", value="a"),
@@ -407,124 +322,99 @@ class TestSelectSingle:
             SelectItem(label="C", value="c"),
         ]
 
-        with (
-            patch("pgboundary.cli_widgets.Live", return_value=mock_live),
-            patch("pgboundary.cli_widgets.readchar.readkey", return_value=readchar.key.ENTER),
-        ):
-            result = select_single(items, default_index=2)
+        stub_readkey(ENTER)
+        result = select_single(items, default_index=2)
 
         assert result.value == "c"
 
-    def test_default_index_out_of_bounds(self, mock_live: MagicMock) -> None:
+    def test_default_index_out_of_bounds(self, stub_readkey: Callable[..., None]) -> None:
         """Test index par défaut hors limites."""
-        items = [
-            SelectItem(label="A", value="a"),
-            SelectItem(label="B", value="b"),
-        ]
+        items = list(_SELECT_AB)
 
-        with (
-            patch("pgboundary.cli_widgets.Live", return_value=mock_live),
-            patch("pgboundary.cli_widgets.readchar.readkey", return_value=readchar.key.ENTER),
-        ):
-            result = select_single(items, default_index=10)
+        stub_readkey(ENTER)
+        result = select_single(items, default_index=10)
 
         # Devrait être limité au dernier élément
         assert result.value == "b"
 
-    def test_enter_variations(self, mock_live: MagicMock) -> None:
+    @pytest.mark.parametrize(
+        "enter_key",
+        [
+            pytest.param(ENTER, id="readchar_enter"),
+            pytest.param("\r", id="carriage_return"),
+            pytest.param("\n", id="newline"),
+        ],
+    )
+    def test_enter_variations(self, stub_readkey: Callable[..., None], enter_key: str) -> None:
         """Test différentes variantes de Enter."""
         items = [SelectItem(label="A", value="a")]
 
-        for enter_key in [readchar.key.ENTER, "\r", "\n"]:
-            with (
-                patch("pgboundary.cli_widgets.Live", return_value=mock_live),
-                patch("pgboundary.cli_widgets.readchar.readkey", return_value=enter_key),
-            ):
-                result = select_single(items)
-            assert result.value == "a"
+        stub_readkey(enter_key)
+        result = select_single(items)
+
+        assert result.value == "a"
 
 
 class TestSelectTerritory:
     """Tests pour select_territory."""
 
-    @pytest.fixture
-    def mock_live(self) -> MagicMock:
-        """Mock pour Rich Live."""
-        mock = MagicMock()
-        mock.__enter__ = MagicMock(return_value=mock)
-        mock.__exit__ = MagicMock(return_value=False)
-        return mock
-
-    def test_default_fra(self, mock_live: MagicMock) -> None:
-        """Test sélection par défaut FRA."""
-        territories = ["FXX", "FRA", "GLP"]
-
-        with (
-            patch("pgboundary.cli_widgets.Live", return_value=mock_live),
-            patch("pgboundary.cli_widgets.readchar.readkey", return_value=readchar.key.ENTER),
-        ):
-            result = select_territory(territories)
-
-        assert result.value == "FRA"  # FRA est le défaut
-
-    def test_custom_default(self, mock_live: MagicMock) -> None:
+    @pytest.mark.parametrize(
+        ("territories", "key", "expected"),
+        [
+            pytest.param(["FXX", "FRA", "GLP"], ENTER, "FRA", id="default_fra"),
+            # Annulation immédiate : les territoires connus s'affichent sans erreur
+            pytest.param(
+                ["FRA", "FXX", "GLP", "MTQ", "GUF", "REU", "MYT"],
+                "\x1b",
+                None,
+                id="known_territories_cancelled",
+            ),
+        ],
+    )
+    def test_default_selection(
+        self,
+        stub_readkey: Callable[..., None],
+        territories: list[str],
+        key: str,
+        expected: str | None,
+    ) -> None:
+        """Test du choix par défaut (FRA), ou de l'annulation si expected est None."""
+        stub_readkey(key)
+        result = select_territory(territories)
+
+        if expected is None:
+            assert result.cancelled is True
+        else:
+            assert result.value == expected
+
+    def test_custom_default(self, stub_readkey: Callable[..., None]) -> None:
         """Test avec défaut personnalisé."""
         territories = ["FXX", "FRA", "GLP"]
 
-        with (
-            patch("pgboundary.cli_widgets.Live", return_value=mock_live),
-            patch("pgboundary.cli_widgets.readchar.readkey", return_value=readchar.key.ENTER),
-        ):
-            result = select_territory(territories, default="GLP")
+        stub_readkey(ENTER)
+        result = select_territory(territories, default="GLP")
 
         assert result.value == "GLP"
 
-    def test_known_territories_have_descriptions(self, mock_live: MagicMock) -> None:
-        """Test que les territoires connus ont des descriptions."""
-        territories = ["FRA", "FXX", "GLP", "MTQ", "GUF", "REU", "MYT"]
-
-        with (
-            patch("pgboundary.cli_widgets.Live", return_value=mock_live),
-            patch("pgboundary.cli_widgets.readchar.readkey", return_value="\x1b"),
-        ):
-            # On annule juste pour vérifier que ça ne plante pas
-            result = select_territory(territories)
-
-        assert result.cancelled is True
-
 
 class TestSelectFormat:
     """Tests pour select_format."""
 
-    @pytest.fixture
-    def mock_live(self) -> MagicMock:
-        """Mock pour Rich Live."""
-        mock = MagicMock()
-        mock.__enter__ = MagicMock(return_value=mock)
-        mock.__exit__ = MagicMock(return_value=False)
-        return mock
-
-    def test_default_shp(self, mock_live: MagicMock) -> None:
+    def test_default_shp(self, stub_readkey: Callable[..., None]) -> None:
         """Test sélection par défaut shp."""
         formats = ["gpkg", "shp", "geojson"]
 
-        with (
-            patch("pgboundary.cli_widgets.Live", return_value=mock_live),
-            patch("pgboundary.cli_widgets.readchar.readkey", return_value=readchar.key.ENTER),
-        ):
-            result = select_format(formats)
+        stub_readkey(ENTER)
+        result = select_format(formats)
 
         assert result.value == "shp"
 
-    def test_custom_default(self, mock_live: MagicMock) -> None:
+    def test_custom_default(self, stub_readkey: Callable[..., None]) -> None:
         """Test avec défaut personnalisé."""
         formats = ["gpkg", "shp"]
 
-        with (
-            patch("pgboundary.cli_widgets.Live", return_value=mock_live),
-            patch("pgboundary.cli_widgets.readchar.readkey", return_value=readchar.key.ENTER),
-        ):
-            result = select_format(formats, default="gpkg")
+        stub_readkey(ENTER)
+        result = select_format(formats, default="gpkg")
 
         assert result.value == "gpkg"
 
@@ -532,30 +422,19 @@ class TestSelectFormat:
 class TestSelectLayers:
     """Tests pour select_layers."""
 
-    @pytest.fixture
-    def mock_live(self) -> MagicMock:
-        """Mock pour Rich Live."""
-        mock = MagicMock()
-        mock.__enter__ = MagicMock(return_value=mock)
-        mock.__exit__ = MagicMock(return_value=False)
-        return mock
-
-    def test_all_preselected_by_default(self, mock_live: MagicMock) -> None:
+    def test_all_preselected_by_default(self, stub_readkey: Callable[..., None]) -> None:
         """Test que tout est sélectionné par défaut."""
         layers = [
             ("REGION", "Régions"),
             ("DEPARTEMENT", "Départements"),
         ]
 
-        with (
-            patch("pgboundary.cli_widgets.Live", return_value=mock_live),
-            patch("pgboundary.cli_widgets.readchar.readkey", return_value=readchar.key.ENTER),
-        ):
-            result = select_layers(layers)
+        stub_readkey(ENTER)
+        result = select_layers(layers)
 
         assert result.selected_values == ["REGION", "DEPARTEMENT"]
 
-    def test_custom_preselection(self, mock_live: MagicMock) -> None:
+    def test_custom_preselection(self, stub_readkey: Callable[..., None]) -> None:
         """Test avec présélection personnalisée."""
         layers = [
             ("REGION", "Régions"),
@@ -563,11 +442,8 @@ class TestSelectLayers:
             ("COMMUNE", "Communes"),
         ]
 
-        with (
-            patch("pgboundary.cli_widgets.Live", return_value=mock_live),
-            patch("pgboundary.cli_widgets.readchar.readkey", return_value=readchar.key.ENTER),
-        ):
-            result = select_layers(layers, preselected=["COMMUNE"])
+        stub_readkey(ENTER)
+        result = select_layers(layers, preselected=["COMMUNE"])
 
         assert result.selected_values == ["COMMUNE"]
 
@@ -575,46 +451,29 @@ class TestSelectLayers:
 class TestSelectEditions:
     """Tests pour select_editions."""
 
-    @pytest.fixture
-    def mock_live(self) -> MagicMock:
-        """Mock pour Rich Live."""
-        mock = MagicMock()
-        mock.__enter__ = MagicMock(return_value=mock)
-        mock.__exit__ = MagicMock(return_value=False)
-        return mock
-
-    def test_default_editions(self, mock_live: MagicMock) -> None:
+    def test_default_editions(self, stub_readkey: Callable[..., None]) -> None:
         """Test génération des éditions par défaut."""
-        with (
-            patch("pgboundary.cli_widgets.Live", return_value=mock_live),
-            patch("pgboundary.cli_widgets.readchar.readkey", return_value=readchar.key.ENTER),
-        ):
-            result = select_editions()
+        stub_readkey(ENTER)
+        result = select_editions()
 
         # Aucun millésime disponible → annulé
         assert result.cancelled is True
 
-    def test_custom_editions(self, mock_live: MagicMock) -> None:
+    def test_custom_editions(self, stub_readkey: Callable[..., None]) -> None:
         """Test avec éditions personnalisées."""
         editions = ["2024", "2023", "2022"]
 
-        with (
-            patch("pgboundary.cli_widgets.Live", return_value=mock_live),
-            patch("pgboundary.cli_widgets.readchar.readkey", return_value=readchar.key.ENTER),
-        ):
-            result = select_editions(available_editions=editions)
+        stub_readkey(ENTER)
+        result = select_editions(available_editions=editions)
 
         # La première édition (2024) devrait être sélectionnée
         assert result.selected_values == ["2024"]
 
-    def test_custom_preselection(self, mock_live: MagicMock) -> None:
+    def test_custom_preselection(self, stub_readkey: Callable[..., None]) -> None:
         """Test avec présélection personnalisée."""
         editions = ["2024", "2023", "2022"]
 
-        with (
-            patch("pgboundary.cli_widgets.Live", return_value=mock_live),
-            patch("pgboundary.cli_widgets.readchar.readkey", return_value=readchar.key.ENTER),
-        ):
-            result = select_editions(available_editions=editions, preselected=["2023", "2022"])
+        stub_readkey(ENTER)
+        result = select_editions(available_editions=editions, preselected=["2023", "2022"])
 
         assert set(result.selected_values) == {"2023", "2022"}
@@ -13,6 +13,31 @@ from pgboundary.products.catalog import get_codes_postaux_product
 from pgboundary.products.codes_postaux import CODES_POSTAUX_PRODUCTS
 
 
+def _shared_loader(source, session_settings):
+    """Construit un loader partagé par le module et le ferme à la fin."""
+    loader = CodesPostauxLoader(source=source, settings=session_settings)
+    yield loader
+    loader.close()
+
+
+@pytest.fixture(scope="module")
+def ban_loader(session_settings):
+    """Loader BAN partagé (les tests ne doivent pas modifier son état)."""
+    yield from _shared_loader("ban", session_settings)
+
+
+@pytest.fixture(scope="module")
+def laposte_loader(session_settings):
+    """Loader La Poste partagé (les tests ne doivent pas modifier son état)."""
+    yield from _shared_loader("laposte", session_settings)
+
+
+@pytest.fixture(scope="module")
+def voronoi_loader(session_settings):
+    """Loader Voronoï partagé (les tests ne doivent pas modifier son état)."""
+    yield from _shared_loader("voronoi", session_settings)
+
+
 class TestCodesPostauxProducts:
     """Tests pour les définitions de produits codes postaux."""
 
@@ -29,29 +54,20 @@ class TestCodesPostauxProducts:
             assert product.category is not None
             assert len(product.formats) > 0
 
-    def test_get_codes_postaux_product_ban(self):
-        """Vérifie la récupération du produit BAN."""
-        product = get_codes_postaux_product("ban")
+    @pytest.mark.parametrize(
+        ("source", "expected_in_id"),
+        [
+            pytest.param("ban", "ban", id="ban"),
+            pytest.param("laposte", "laposte", id="laposte"),
+            pytest.param("geoclip", "geoclip", id="geoclip"),
+            pytest.param("voronoi", "generated", id="voronoi"),
+        ],
+    )
+    def test_get_codes_postaux_product(self, source, expected_in_id):
+        """Vérifie la récupération du produit pour chaque source."""
+        product = get_codes_postaux_product(source)
         assert product is not None
-        assert "ban" in product.id.lower()
-
-    def test_get_codes_postaux_product_laposte(self):
-        """Vérifie la récupération du produit La Poste."""
-        product = get_codes_postaux_product("laposte")
-        assert product is not None
-        assert "laposte" in product.id.lower()
-
-    def test_get_codes_postaux_product_geoclip(self):
-        """Vérifie la récupération du produit Géoclip."""
-        product = get_codes_postaux_product("geoclip")
-        assert product is not None
-        assert "geoclip" in product.id.lower()
-
-    def test_get_codes_postaux_product_voronoi(self):
-        """Vérifie la récupération du produit Voronoï."""
-        product = get_codes_postaux_product("voronoi")
-        assert product is not None
-        assert "generated" in product.id.lower()
+        assert expected_in_id in product.id.lower()
 
     def test_get_codes_postaux_product_generated_alias(self):
         """Vérifie que 'generated' est un alias pour 'voronoi'."""
@@ -68,22 +84,11 @@ class TestCodesPostauxProducts:
 class TestCodesPostauxLoader:
     """Tests pour le loader de codes postaux."""
 
-    def test_loader_init_ban(self, settings):
-        """Vérifie l'initialisation avec la source BAN."""
-        loader = CodesPostauxLoader(source="ban", settings=settings)
-        assert loader.source == "ban"
-        assert loader.product is not None
-
-    def test_loader_init_laposte(self, settings):
-        """Vérifie l'initialisation avec la source La Poste."""
-        loader = CodesPostauxLoader(source="laposte", settings=settings)
-        assert loader.source == "laposte"
-        assert loader.product is not None
-
-    def test_loader_init_voronoi(self, settings):
-        """Vérifie l'initialisation avec la source Voronoï."""
-        loader = CodesPostauxLoader(source="voronoi", settings=settings)
-        assert loader.source == "voronoi"
+    @pytest.mark.parametrize("source", ["ban", "laposte", "voronoi"])
+    def test_loader_init(self, settings, source):
+        """Vérifie l'initialisation pour chaque source."""
+        loader = CodesPostauxLoader(source=source, settings=settings)
+        assert loader.source == source
         assert loader.product is not None
 
     def test_loader_init_invalid_source(self, settings):
@@ -108,45 +113,46 @@ class TestCodesPostauxLoader:
         assert loader._client is None
 
 
+# Extraits de la base officielle La Poste (séparateurs point-virgule et virgule)
+_LAPOSTE_CSV_SEMICOLON = """code_postal;code_commune_insee;nom_de_la_commune;Longitude;Latitude
+75001;75101;PARIS 01;2.3455;48.8603
+75002;75102;PARIS 02;2.3445;48.8670
+"""
+_LAPOSTE_CSV_COMMA = """code_postal,code_commune_insee,nom_de_la_commune,Longitude,Latitude
+75001,75101,PARIS 01,2.3455,48.8603
+"""
+
+
 class TestCodesPostauxLoaderParsing:
     """Tests pour les méthodes de parsing du loader."""
 
-    def test_parse_laposte_csv_semicolon(self, settings):
+    def test_parse_laposte_csv_semicolon(self, laposte_loader):
         """Vérifie le parsing d'un CSV avec séparateur point-virgule."""
-        csv_content = """code_postal;code_commune_insee;nom_de_la_commune;Longitude;Latitude
-75001;75101;PARIS 01;2.3455;48.8603
-75002;75102;PARIS 02;2.3445;48.8670
-"""
-        loader = CodesPostauxLoader(source="laposte", settings=settings)
-        gdf = loader._parse_laposte_csv(csv_content)
+        gdf = laposte_loader._parse_laposte_csv(_LAPOSTE_CSV_SEMICOLON)
 
         assert len(gdf) == 2
         assert "cd_postal" in gdf.columns
         assert "cd_insee" in gdf.columns
         assert gdf.geometry.dtype.name == "geometry"
+        assert gdf.crs.to_epsg() == 4326
 
-    def test_parse_laposte_csv_comma(self, settings):
+    def test_parse_laposte_csv_comma(self, laposte_loader):
         """Vérifie le parsing d'un CSV avec séparateur virgule."""
-        csv_content = """code_postal,code_commune_insee,nom_de_la_commune,Longitude,Latitude
-75001,75101,PARIS 01,2.3455,48.8603
-"""
-        loader = CodesPostauxLoader(source="laposte", settings=settings)
-        gdf = loader._parse_laposte_csv(csv_content)
+        gdf = laposte_loader._parse_laposte_csv(_LAPOSTE_CSV_COMMA)
 
         assert len(gdf) == 1
         assert gdf.iloc[0]["cd_postal"] == "75001"
 
-    def test_parse_laposte_csv_empty(self, settings):
+    def test_parse_laposte_csv_empty(self, laposte_loader):
         """Vérifie qu'un CSV vide lève une erreur."""
         from pgboundary.exceptions import LoaderError
 
         csv_content = "code_postal;code_commune_insee\n"
-        loader = CodesPostauxLoader(source="laposte", settings=settings)
 
         with pytest.raises(LoaderError, match="vide"):
-            loader._parse_laposte_csv(csv_content)
+            laposte_loader._parse_laposte_csv(csv_content)
 
-    def test_prepare_ban_gdf(self, settings):
+    def test_prepare_ban_gdf(self, ban_loader):
         """Vérifie la préparation du GeoDataFrame BAN."""
         gdf = gpd.GeoDataFrame(
             {
@@ -160,15 +166,14 @@ class TestCodesPostauxLoaderParsing:
             crs="EPSG:4326",
         )
 
-        loader = CodesPostauxLoader(source="ban", settings=settings)
-        result = loader._prepare_ban_gdf(gdf)
+        result = ban_loader._prepare_ban_gdf(gdf)
 
         assert "cd_postal" in result.columns
         assert "nb_adresses" in result.columns
         assert "uid" in result.columns
         assert "codePostal" not in result.columns
 
-    def test_ensure_multipolygon(self, settings):
+    def test_ensure_multipolygon(self, ban_loader):
         """Vérifie la conversion en MultiPolygon."""
         polygon = Polygon([(0, 0), (1, 0), (1, 1), (0, 1)])
         gdf = gpd.GeoDataFrame(
@@ -177,12 +182,46 @@ class TestCodesPostauxLoaderParsing:
             crs="EPSG:4326",
         )
 
-        loader = CodesPostauxLoader(source="ban", settings=settings)
-        result = loader._ensure_multipolygon(gdf)
+        result = ban_loader._ensure_multipolygon(gdf)
 
         assert isinstance(result.iloc[0].geometry, MultiPolygon)
 
 
+@pytest.fixture(scope="module")
+def voronoi_points_gdf():
+    """Points de cinq codes postaux parisiens (lecture seule)."""
+    return gpd.GeoDataFrame(
+        {"cd_postal": ["75001", "75002", "75003", "75004", "75005"]},
+        geometry=[
+            Point(2.34, 48.86),
+            Point(2.35, 48.87),
+            Point(2.36, 48.86),
+            Point(2.35, 48.85),
+            Point(2.34, 48.87),
+        ],
+        crs="EPSG:4326",
+    )
+
+
+@pytest.fixture(scope="module")
+def voronoi_boundary_2154():
+    """Limite simplifiée (carré) reprojetée une seule fois en Lambert 93 (lecture seule)."""
+    return gpd.GeoDataFrame(
+        {"id": [1]},
+        geometry=[
+            Polygon(
+                [
+                    (2.33, 48.84),
+                    (2.37, 48.84),
+                    (2.37, 48.88),
+                    (2.33, 48.88),
+                ]
+            )
+        ],
+        crs="EPSG:4326",
+    ).to_crs(epsg=2154)
+
+
 class TestCodesPostauxLoaderVoronoi:
     """Tests pour la génération Voronoï."""
 
@@ -191,98 +230,65 @@ class TestCodesPostauxLoaderVoronoi:
         """Skip les tests si scipy n'est pas installé."""
         pytest.importorskip("scipy")
 
-    def test_generate_voronoi_basic(self, settings):
+    def test_generate_voronoi_basic(
+        self, voronoi_loader, voronoi_points_gdf, voronoi_boundary_2154
+    ):
         """Vérifie la génération basique de Voronoï."""
-        # Points pour les codes postaux
-        points_gdf = gpd.GeoDataFrame(
-            {"cd_postal": ["75001", "75002", "75003", "75004", "75005"]},
-            geometry=[
-                Point(2.34, 48.86),
-                Point(2.35, 48.87),
-                Point(2.36, 48.86),
-                Point(2.35, 48.85),
-                Point(2.34, 48.87),
-            ],
-            crs="EPSG:4326",
-        )
-
-        # Limite simplifiée (carré)
-        boundaries_gdf = gpd.GeoDataFrame(
-            {"id": [1]},
-            geometry=[
-                Polygon(
-                    [
-                        (2.33, 48.84),
-                        (2.37, 48.84),
-                        (2.37, 48.88),
-                        (2.33, 48.88),
-                    ]
-                )
-            ],
-            crs="EPSG:4326",
-        ).to_crs(epsg=2154)
-
-        loader = CodesPostauxLoader(source="voronoi", settings=settings)
-        result = loader._generate_voronoi(points_gdf, boundaries_gdf)
+        result = voronoi_loader._generate_voronoi(voronoi_points_gdf, voronoi_boundary_2154)
 
         assert len(result) > 0
         assert "cd_postal" in result.columns
         assert "uid" in result.columns
         assert result.crs.to_epsg() == 2154
 
-    def test_generate_voronoi_insufficient_points(self, settings):
+    def test_generate_voronoi_insufficient_points(
+        self, voronoi_loader, voronoi_points_gdf, voronoi_boundary_2154
+    ):
         """Vérifie qu'une erreur est levée avec trop peu de points."""
         from pgboundary.exceptions import LoaderError
 
-        points_gdf = gpd.GeoDataFrame(
-            {"cd_postal": ["75001", "75002"]},
-            geometry=[Point(2.34, 48.86), Point(2.35, 48.87)],
-            crs="EPSG:4326",
-        )
+        with pytest.raises(LoaderError, match="Pas assez de points"):
+            voronoi_loader._generate_voronoi(voronoi_points_gdf.head(2), voronoi_boundary_2154)
 
-        boundaries_gdf = gpd.GeoDataFrame(
-            {"id": [1]},
-            geometry=[Polygon([(0, 0), (1, 0), (1, 1), (0, 1)])],
-            crs="EPSG:4326",
-        ).to_crs(epsg=2154)
 
-        loader = CodesPostauxLoader(source="voronoi", settings=settings)
+@pytest.fixture(scope="module")
+def ban_geojson_bytes():
+    """GeoJSON BAN minimal (une commune), construit une fois par module."""
+    return b"""{
+        "type": "FeatureCollection",
+        "features": [
+            {
+                "type": "Feature",
+                "properties": {"codePostal": "75001", "nbNumeros": 1000},
+                "geometry": {"type": "Polygon", "coordinates": [[[2.33, 48.85], [2.34, 48.85], [2.34, 48.86], [2.33, 48.86], [2.33, 48.85]]]}
+            }
+        ]
+    }"""
 
-        with pytest.raises(LoaderError, match="Pas assez de points"):
-            loader._generate_voronoi(points_gdf, boundaries_gdf)
+
+@pytest.fixture
+def mock_httpx_client(ban_geojson_bytes):
+    """Client HTTP mocké dont GET renvoie le GeoJSON BAN."""
+    client = MagicMock()
+    client.get.return_value.content = ban_geojson_bytes
+    return client
 
 
 class TestCodesPostauxLoaderIntegration:
     """Tests d'intégration pour le loader (avec mocking)."""
 
-    @patch("httpx.Client")
-    def test_load_ban_downloads_data(self, mock_client_class, settings):
+    def test_load_ban_downloads_data(self, mock_httpx_client, settings):
         """Vérifie que load télécharge les données BAN."""
-        mock_response = MagicMock()
-        mock_response.content = b"""{
-            "type": "FeatureCollection",
-            "features": [
-                {
-                    "type": "Feature",
-                    "properties": {"codePostal": "75001", "nbNumeros": 1000},
-                    "geometry": {"type": "Polygon", "coordinates": [[[2.33, 48.85], [2.34, 48.85], [2.34, 48.86], [2.33, 48.86], [2.33, 48.85]]]}
-                }
-            ]
-        }"""
-        mock_response.raise_for_status = MagicMock()
-
-        mock_client = MagicMock()
-        mock_client.get.return_value = mock_response
-        mock_client_class.return_value = mock_client
-
         loader = CodesPostauxLoader(source="ban", settings=settings)
-        loader._client = mock_client
+        loader._client = mock_httpx_client
 
         # Mock de load_geodataframe
         with patch.object(loader, "load_geodataframe", return_value=1):
             count = loader.load()
             assert count == 1
 
+        mock_httpx_client.get.assert_called_once_with(loader.product.url_template)
+
     def test_load_voronoi_requires_admin_express_path(self, settings):
         """Vérifie que la génération Voronoï nécessite admin_express_path."""
         from pgboundary.exceptions import LoaderError
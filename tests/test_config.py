@@ -2,6 +2,9 @@
 
 from pathlib import Path
 
+import pytest
+from pydantic import ValidationError
+
 from pgboundary.config import Settings
 from pgboundary.schema_config import SchemaConfig, StorageMode
 
@@ -49,6 +52,23 @@ class TestSettings:
         assert isinstance(config, SchemaConfig)
         assert config.storage.mode == StorageMode.SCHEMA
 
+    @pytest.mark.parametrize(
+        ("field", "value"),
+        [
+            pytest.param("db_pool_size", 0, id="pool_size"),
+            pytest.param("db_max_overflow", -1, id="max_overflow"),
+            pytest.param("db_pool_recycle", -5, id="pool_recycle"),
+        ],
+    )
+    def test_pool_settings_bounds(self, field: str, value: int) -> None:
+        """Teste que les paramètres du pool hors bornes sont refusés."""
+        with pytest.raises(ValidationError, match=field):
+            Settings.model_validate({field: value})
+
+    def test_pool_recycle_unlimited(self) -> None:
+        """Teste que -1 (durée de vie illimitée) reste accepté."""
+        assert Settings(db_pool_recycle=-1).db_pool_recycle == -1
+
 
 class TestSchemaConfig:
     """Tests pour la configuration du schéma."""
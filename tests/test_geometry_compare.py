@@ -6,25 +6,69 @@ pour l'historisation des données.
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, Any
+from unittest.mock import MagicMock
+
+import numpy as np
 import pytest
+import shapely
+from numpy.testing import assert_array_equal
 from shapely.geometry import MultiPolygon, Point, Polygon
 
+from pgboundary import geometry_compare
 from pgboundary.geometry_compare import (
     GeometryMatcher,
+    _classify_hausdorff_only,
+    _classify_iou_only,
     are_geometries_similar,
     compute_combined_similarity,
     compute_geometry_hash,
     compute_hausdorff_distance,
     compute_jaccard_index,
+    compute_jaccard_index_batch,
     compute_similarity,
     compute_similarity_score,
 )
 from pgboundary.import_config import (
+    DEFAULT_THRESHOLDS,
     SimilarityLevel,
     SimilarityMethod,
     SimilarityThresholds,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    import numpy.typing as npt
+
+# Seuils partagés par les tests de classification (instances immuables)
+_HAUSDORFF_THRESHOLDS = SimilarityThresholds(hausdorff_max=10.0)
+
+# Carré 1x1 décalé en x de 0.5 et de 0.1 (immuables, partagés)
+_SHIFTED_X_05 = Polygon([(0.5, 0), (1.5, 0), (1.5, 1), (0.5, 1), (0.5, 0)])
+_SHIFTED_X_01 = Polygon([(0.1, 0), (1.1, 0), (1.1, 1), (0.1, 1), (0.1, 0)])
+
+# Contour de sample_polygon (carré 1x1)
+_UNIT_SQUARE = [(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0), (0.0, 0.0)]
+
+
+def _make_features(n: int, jitter: float = 0.0, seed: int = 0) -> list[dict[str, Any]]:
+    """Construit ``n`` entités (01001, 01002…) en un seul appel GEOS.
+
+    Chaque contour est le carré unité, translaté au hasard d'au plus ``jitter``.
+    """
+    offsets = np.random.default_rng(seed).uniform(0.0, jitter, size=(n, 1, 2))
+    coords = np.array(_UNIT_SQUARE) + offsets
+    return [
+        {"cd_insee": f"{1001 + i:05d}", "geometry": geometry}
+        for i, geometry in enumerate(shapely.polygons(coords))
+    ]
+
+
+def _ids(features: Iterable[dict[str, Any]]) -> npt.NDArray[np.str_]:
+    """Codes ``cd_insee`` des entités, triés (comparaison indépendante de l'ordre)."""
+    return np.sort(np.fromiter((f["cd_insee"] for f in features), dtype="U5"))
+
 
 class TestComputeGeometryHash:
     """Tests pour compute_geometry_hash."""
@@ -33,7 +77,7 @@ class TestComputeGeometryHash:
         """Test du hash d'un polygone."""
         hash_value = compute_geometry_hash(sample_polygon)
         assert isinstance(hash_value, str)
-        assert len(hash_value) == 32  # MD5 hex length
+        assert len(hash_value) == 64  # SHA-256 hex length
 
     def test_hash_same_polygon_twice(self, sample_polygon: Polygon) -> None:
         """Test que le même polygone donne le même hash."""
@@ -60,17 +104,27 @@ class TestComputeGeometryHash:
         empty = Polygon()
         assert compute_geometry_hash(empty) == ""
 
-    def test_hash_multipolygon(self, sample_multipolygon: MultiPolygon) -> None:
-        """Test du hash d'un MultiPolygon."""
+    def test_hash_multipolygon(
+        self,
+        sample_multipolygon: MultiPolygon,
+        sample_polygon_different: Polygon,
+    ) -> None:
+        """Test du hash d'un MultiPolygon (contours de toutes ses parties)."""
+        other = MultiPolygon([sample_polygon_different])
         hash_value = compute_geometry_hash(sample_multipolygon)
-        # MultiPolygon without exterior coords returns WKT-based hash
-        assert isinstance(hash_value, str)
+        assert len(hash_value) == 64
+        assert hash_value != compute_geometry_hash(other)
+
+    def test_hash_ignores_ring_start(self, sample_polygon: Polygon) -> None:
+        """Test que le point de départ et le sens du contour n'influent pas sur le hash."""
+        rotated = Polygon([(1, 1), (0, 1), (0, 0), (1, 0), (1, 1)])
+        assert compute_geometry_hash(rotated) == compute_geometry_hash(sample_polygon)
 
     def test_hash_point(self, sample_point: Point) -> None:
         """Test du hash d'un point."""
         hash_value = compute_geometry_hash(sample_point)
         assert isinstance(hash_value, str)
-        assert len(hash_value) == 32
+        assert len(hash_value) == 64
 
 
 class TestComputeJaccardIndex:
@@ -79,13 +133,12 @@ class TestComputeJaccardIndex:
     def test_identical_polygons(self, sample_polygon: Polygon) -> None:
         """Test IoU de polygones identiques."""
         iou = compute_jaccard_index(sample_polygon, sample_polygon)
-        assert iou == pytest.approx(1.0)
+        assert iou == 1.0
 
     def test_overlapping_polygons(self, sample_polygon: Polygon) -> None:
         """Test IoU de polygones avec chevauchement partiel."""
         # Décalage de 0.5 = 50% de chevauchement
-        shifted = Polygon([(0.5, 0), (1.5, 0), (1.5, 1), (0.5, 1), (0.5, 0)])
-        iou = compute_jaccard_index(sample_polygon, shifted)
+        iou = compute_jaccard_index(sample_polygon, _SHIFTED_X_05)
         # Intersection = 0.5, Union = 1.5, IoU = 0.5/1.5 = 0.333...
         assert 0.3 < iou < 0.4
 
@@ -96,7 +149,7 @@ class TestComputeJaccardIndex:
     ) -> None:
         """Test IoU de polygones sans chevauchement."""
         iou = compute_jaccard_index(sample_polygon, sample_polygon_different)
-        assert iou == pytest.approx(0.0)
+        assert iou == 0.0
 
     def test_with_none(self, sample_polygon: Polygon) -> None:
         """Test IoU avec None."""
@@ -109,6 +162,32 @@ class TestComputeJaccardIndex:
         assert compute_jaccard_index(empty, sample_polygon) == 0.0
         assert compute_jaccard_index(sample_polygon, empty) == 0.0
 
+    @pytest.mark.parametrize("size", [pytest.param(1, id="1"), pytest.param(500, id="500")])
+    def test_batch_identical(self, sample_polygon: Polygon, size: int) -> None:
+        """Test IoU par lot de polygones identiques."""
+        batch = np.full(size, sample_polygon, dtype=object)
+        iou = compute_jaccard_index_batch(batch, batch)
+        assert iou.tolist() == [1.0] * size
+
+    def test_batch_matches_scalar(
+        self,
+        sample_polygon: Polygon,
+        sample_polygon_shifted: Polygon,
+        sample_polygon_different: Polygon,
+    ) -> None:
+        """Test que l'IoU par lot égale l'IoU paire par paire (None et vide compris)."""
+        geoms1 = [sample_polygon, sample_polygon, sample_polygon, None, Polygon()]
+        geoms2 = [
+            sample_polygon,
+            sample_polygon_shifted,
+            sample_polygon_different,
+            sample_polygon,
+            sample_polygon,
+        ]
+        expected = [compute_jaccard_index(g1, g2) for g1, g2 in zip(geoms1, geoms2, strict=True)]
+
+        assert compute_jaccard_index_batch(geoms1, geoms2).tolist() == pytest.approx(expected)
+
 
 class TestComputeHausdorffDistance:
     """Tests pour compute_hausdorff_distance."""
@@ -116,7 +195,7 @@ class TestComputeHausdorffDistance:
     def test_identical_polygons(self, sample_polygon: Polygon) -> None:
         """Test distance de Hausdorff de polygones identiques."""
         distance = compute_hausdorff_distance(sample_polygon, sample_polygon)
-        assert distance == pytest.approx(0.0)
+        assert distance == 0.0
 
     def test_shifted_polygons(
         self,
@@ -157,7 +236,7 @@ class TestComputeCombinedSimilarity:
         """Test similarité de polygones identiques."""
         result = compute_combined_similarity(sample_polygon, sample_polygon)
         assert result.level == SimilarityLevel.IDENTICAL
-        assert result.iou_score == pytest.approx(1.0)
+        assert result.iou_score == 1.0
         assert result.is_auto_merge() is True
 
     def test_slightly_shifted_polygons(
@@ -183,7 +262,7 @@ class TestComputeCombinedSimilarity:
         """Test similarité de polygones très différents."""
         result = compute_combined_similarity(sample_polygon, sample_polygon_different)
         assert result.level == SimilarityLevel.DISTINCT
-        assert result.iou_score == pytest.approx(0.0)
+        assert result.iou_score == 0.0
 
     def test_with_none(self, sample_polygon: Polygon) -> None:
         """Test avec None."""
@@ -206,9 +285,8 @@ class TestComputeCombinedSimilarity:
 
     def test_likely_match_with_hausdorff(self, sample_polygon: Polygon) -> None:
         """Test LIKELY_MATCH avec vérification Hausdorff."""
-        # Créer un polygone avec IoU entre 0.80 et 0.95
-        shifted = Polygon([(0.1, 0), (1.1, 0), (1.1, 1), (0.1, 1), (0.1, 0)])
-        result = compute_combined_similarity(sample_polygon, shifted)
+        # Carré décalé de 0.1 : IoU entre 0.80 et 0.95
+        result = compute_combined_similarity(sample_polygon, _SHIFTED_X_01)
         # Le résultat dépend de l'IoU exact
         assert result.iou_score > 0.0
 
@@ -240,11 +318,10 @@ class TestAreGeometriesSimilar:
 
     def test_jaccard_with_threshold(self, sample_polygon: Polygon) -> None:
         """Test Jaccard avec seuil personnalisé."""
-        shifted = Polygon([(0.1, 0), (1.1, 0), (1.1, 1), (0.1, 1), (0.1, 0)])
         # Avec seuil bas
         result = are_geometries_similar(
             sample_polygon,
-            shifted,
+            _SHIFTED_X_01,
             SimilarityMethod.JACCARD,
             threshold=0.5,
         )
@@ -253,19 +330,22 @@ class TestAreGeometriesSimilar:
         # Avec seuil haut
         result = are_geometries_similar(
             sample_polygon,
-            shifted,
+            _SHIFTED_X_01,
             SimilarityMethod.JACCARD,
             threshold=0.99,
         )
         assert result is False
 
-    def test_hausdorff_with_threshold(self, sample_polygon: Polygon) -> None:
+    def test_hausdorff_with_threshold(
+        self,
+        sample_polygon: Polygon,
+        sample_polygon_shifted: Polygon,
+    ) -> None:
         """Test Hausdorff avec seuil personnalisé."""
-        shifted = Polygon([(0.1, 0.1), (1.1, 0.1), (1.1, 1.1), (0.1, 1.1), (0.1, 0.1)])
         # Seuil large
         result = are_geometries_similar(
             sample_polygon,
-            shifted,
+            sample_polygon_shifted,
             SimilarityMethod.HAUSDORFF,
             threshold=1.0,
         )
@@ -274,7 +354,7 @@ class TestAreGeometriesSimilar:
         # Seuil strict
         result = are_geometries_similar(
             sample_polygon,
-            shifted,
+            sample_polygon_shifted,
             SimilarityMethod.HAUSDORFF,
             threshold=0.01,
         )
@@ -293,33 +373,36 @@ class TestAreGeometriesSimilar:
 class TestComputeSimilarity:
     """Tests pour compute_similarity (fonction principale)."""
 
-    def test_md5_method(self, sample_polygon: Polygon) -> None:
-        """Test avec méthode MD5."""
-        result = compute_similarity(sample_polygon, sample_polygon, SimilarityMethod.MD5)
-        assert result.level == SimilarityLevel.IDENTICAL
-        assert "MD5" in result.reason
-
-    def test_jaccard_method(self, sample_polygon: Polygon) -> None:
-        """Test avec méthode Jaccard."""
-        result = compute_similarity(sample_polygon, sample_polygon, SimilarityMethod.JACCARD)
-        assert result.level == SimilarityLevel.IDENTICAL
-        assert result.iou_score == pytest.approx(1.0)
-
-    def test_hausdorff_method(self, sample_polygon: Polygon) -> None:
-        """Test avec méthode Hausdorff."""
-        result = compute_similarity(sample_polygon, sample_polygon, SimilarityMethod.HAUSDORFF)
-        assert result.level == SimilarityLevel.IDENTICAL
-        assert result.hausdorff_distance == pytest.approx(0.0)
-
-    def test_combined_method(self, sample_polygon: Polygon) -> None:
-        """Test avec méthode combinée."""
-        result = compute_similarity(sample_polygon, sample_polygon, SimilarityMethod.COMBINED)
-        assert result.level == SimilarityLevel.IDENTICAL
+    @pytest.mark.parametrize(
+        ("method", "attribute", "expected"),
+        [
+            pytest.param(
+                SimilarityMethod.MD5,
+                "reason",
+                "Hash SHA-256 des coordonnées identique",
+                id="md5",
+            ),
+            pytest.param(SimilarityMethod.JACCARD, "iou_score", 1.0, id="jaccard"),
+            pytest.param(SimilarityMethod.HAUSDORFF, "hausdorff_distance", 0.0, id="hausdorff"),
+            pytest.param(SimilarityMethod.COMBINED, "iou_score", 1.0, id="combined"),
+            pytest.param(None, "iou_score", 1.0, id="default_is_combined"),
+        ],
+    )
+    def test_identical_polygons(
+        self,
+        sample_polygon: Polygon,
+        method: SimilarityMethod | None,
+        attribute: str,
+        expected: object,
+    ) -> None:
+        """Test de chaque méthode sur deux polygones identiques (None : méthode par défaut)."""
+        if method is None:
+            result = compute_similarity(sample_polygon, sample_polygon)
+        else:
+            result = compute_similarity(sample_polygon, sample_polygon, method)
 
-    def test_default_method_is_combined(self, sample_polygon: Polygon) -> None:
-        """Test que la méthode par défaut est COMBINED."""
-        result = compute_similarity(sample_polygon, sample_polygon)
         assert result.level == SimilarityLevel.IDENTICAL
+        assert getattr(result, attribute) == expected
 
 
 class TestComputeSimilarityScore:
@@ -346,7 +429,7 @@ class TestComputeSimilarityScore:
     def test_jaccard_score(self, sample_polygon: Polygon) -> None:
         """Test score Jaccard."""
         score = compute_similarity_score(sample_polygon, sample_polygon, SimilarityMethod.JACCARD)
-        assert score == pytest.approx(1.0)
+        assert score == 1.0
 
     def test_hausdorff_score(self, sample_polygon: Polygon) -> None:
         """Test score Hausdorff."""
@@ -355,12 +438,12 @@ class TestComputeSimilarityScore:
             sample_polygon,
             SimilarityMethod.HAUSDORFF,
         )
-        assert score == pytest.approx(0.0)  # Distance
+        assert score == 0.0  # Distance
 
     def test_combined_score(self, sample_polygon: Polygon) -> None:
         """Test score combiné."""
         score = compute_similarity_score(sample_polygon, sample_polygon, SimilarityMethod.COMBINED)
-        assert score == pytest.approx(1.0)
+        assert score == 1.0
 
 
 class TestGeometryMatcher:
@@ -396,18 +479,12 @@ class TestGeometryMatcher:
         result = matcher.compare(sample_polygon, sample_polygon)
         assert result.level == SimilarityLevel.IDENTICAL
 
-    def test_find_matches_all_match(self, sample_polygon: Polygon) -> None:
+    def test_find_matches_all_match(self) -> None:
         """Test find_matches avec correspondances complètes."""
         matcher = GeometryMatcher()
 
-        old_features = [
-            {"cd_insee": "01001", "geometry": sample_polygon},
-            {"cd_insee": "01002", "geometry": sample_polygon},
-        ]
-        new_features = [
-            {"cd_insee": "01001", "geometry": sample_polygon},
-            {"cd_insee": "01002", "geometry": sample_polygon},
-        ]
+        old_features = _make_features(2)
+        new_features = _make_features(2)
 
         auto_matches, removed, added, needs_validation = matcher.find_matches(
             old_features,
@@ -419,45 +496,37 @@ class TestGeometryMatcher:
         assert len(added) == 0
         assert len(needs_validation) == 0
 
-    def test_find_matches_with_additions(self, sample_polygon: Polygon) -> None:
+    def test_find_matches_with_additions(self) -> None:
         """Test find_matches avec ajouts."""
         matcher = GeometryMatcher()
 
-        old_features = [{"cd_insee": "01001", "geometry": sample_polygon}]
-        new_features = [
-            {"cd_insee": "01001", "geometry": sample_polygon},
-            {"cd_insee": "01002", "geometry": sample_polygon},
-        ]
+        old_features = _make_features(1)
+        new_features = _make_features(2)
 
         auto_matches, removed, added, _needs_validation = matcher.find_matches(
             old_features,
             new_features,
         )
 
-        assert len(auto_matches) == 1
-        assert len(removed) == 0
-        assert len(added) == 1
-        assert added[0]["cd_insee"] == "01002"
+        assert_array_equal(_ids(new for _old, new, _result in auto_matches), ["01001"])
+        assert_array_equal(_ids(removed), [])
+        assert_array_equal(_ids(added), ["01002"])
 
-    def test_find_matches_with_removals(self, sample_polygon: Polygon) -> None:
+    def test_find_matches_with_removals(self) -> None:
         """Test find_matches avec suppressions."""
         matcher = GeometryMatcher()
 
-        old_features = [
-            {"cd_insee": "01001", "geometry": sample_polygon},
-            {"cd_insee": "01002", "geometry": sample_polygon},
-        ]
-        new_features = [{"cd_insee": "01001", "geometry": sample_polygon}]
+        old_features = _make_features(2)
+        new_features = _make_features(1)
 
         auto_matches, removed, added, _needs_validation = matcher.find_matches(
             old_features,
             new_features,
         )
 
-        assert len(auto_matches) == 1
-        assert len(removed) == 1
-        assert removed[0]["cd_insee"] == "01002"
-        assert len(added) == 0
+        assert_array_equal(_ids(new for _old, new, _result in auto_matches), ["01001"])
+        assert_array_equal(_ids(removed), ["01002"])
+        assert_array_equal(_ids(added), [])
 
     def test_find_matches_no_geometry(self) -> None:
         """Test find_matches sans géométrie (correspondance par clé)."""
@@ -494,74 +563,83 @@ class TestGeometryMatcher:
         assert len(removed) >= 0  # Peut être traité comme suppression
         assert len(added) >= 0  # Peut être traité comme ajout
 
-    def test_get_method_description(self) -> None:
-        """Test de la description des méthodes."""
-        for method in SimilarityMethod:
-            matcher = GeometryMatcher(method=method)
-            desc = matcher.get_method_description()
-            assert isinstance(desc, str)
-            assert len(desc) > 0
+    @pytest.mark.parametrize("method", list(SimilarityMethod), ids=lambda method: method.value)
+    def test_find_matches_same_results_as_compare(self, method: SimilarityMethod) -> None:
+        """Test que la comparaison par lot de find_matches équivaut à compare paire par paire."""
+        matcher = GeometryMatcher(method=method)
+        old_features = _make_features(50)
+        # 10 paires identiques puis des décalages jusqu'à 0.3 : tous les niveaux représentés
+        new_features = _make_features(10) + _make_features(50, jitter=0.3, seed=1)[10:]
+        new_features[0]["geometry"] = Polygon()
 
+        auto_matches, _removed, _added, needs_validation = matcher.find_matches(
+            old_features,
+            new_features,
+        )
 
-class TestClassificationHelpers:
-    """Tests pour les fonctions de classification."""
-
-    def test_classify_iou_identical(self) -> None:
-        """Test classification IoU pour IDENTICAL."""
-        from pgboundary.geometry_compare import _classify_iou_only
-
-        thresholds = SimilarityThresholds()
-        assert _classify_iou_only(0.98, thresholds) == SimilarityLevel.IDENTICAL
-
-    def test_classify_iou_likely_match(self) -> None:
-        """Test classification IoU pour LIKELY_MATCH."""
-        from pgboundary.geometry_compare import _classify_iou_only
-
-        thresholds = SimilarityThresholds()
-        assert _classify_iou_only(0.85, thresholds) == SimilarityLevel.LIKELY_MATCH
-
-    def test_classify_iou_suspect(self) -> None:
-        """Test classification IoU pour SUSPECT."""
-        from pgboundary.geometry_compare import _classify_iou_only
-
-        thresholds = SimilarityThresholds()
-        assert _classify_iou_only(0.60, thresholds) == SimilarityLevel.SUSPECT
-
-    def test_classify_iou_distinct(self) -> None:
-        """Test classification IoU pour DISTINCT."""
-        from pgboundary.geometry_compare import _classify_iou_only
-
-        thresholds = SimilarityThresholds()
-        assert _classify_iou_only(0.30, thresholds) == SimilarityLevel.DISTINCT
+        for old, new, result in auto_matches + needs_validation:
+            assert result == matcher.compare(old["geometry"], new["geometry"])
 
-    def test_classify_hausdorff_identical(self) -> None:
-        """Test classification Hausdorff pour IDENTICAL."""
-        from pgboundary.geometry_compare import _classify_hausdorff_only
+    def test_find_matches_single_batch(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test que find_matches calcule les IoU de 1000 paires en un seul lot.
 
-        thresholds = SimilarityThresholds(hausdorff_max=10.0)
-        # <= 50% du max = IDENTICAL
-        assert _classify_hausdorff_only(4.0, thresholds) == SimilarityLevel.IDENTICAL
+        Garde-fou de performance indépendant de la machine : aucun calcul
+        d'IoU paire par paire, donc pas de coût proportionnel à N appels GEOS.
+        """
+        batch_spy = MagicMock(wraps=compute_jaccard_index_batch)
+        scalar_spy = MagicMock(wraps=compute_jaccard_index)
+        monkeypatch.setattr(geometry_compare, "compute_jaccard_index_batch", batch_spy)
+        monkeypatch.setattr(geometry_compare, "compute_jaccard_index", scalar_spy)
+        matcher = GeometryMatcher()
+        old_features = _make_features(1000)
+        new_features = _make_features(1000, jitter=0.01, seed=1)  # IoU ~0.98
 
-    def test_classify_hausdorff_likely_match(self) -> None:
-        """Test classification Hausdorff pour LIKELY_MATCH."""
-        from pgboundary.geometry_compare import _classify_hausdorff_only
+        auto_matches, removed, added, needs_validation = matcher.find_matches(
+            old_features,
+            new_features,
+        )
 
-        thresholds = SimilarityThresholds(hausdorff_max=10.0)
-        # <= max = LIKELY_MATCH
-        assert _classify_hausdorff_only(8.0, thresholds) == SimilarityLevel.LIKELY_MATCH
+        assert_array_equal(_ids(new for _old, new, _result in auto_matches), _ids(new_features))
+        assert removed == added == []
+        assert needs_validation == []
+        batch_spy.assert_called_once()
+        assert len(batch_spy.call_args.args[0]) == 1000
+        scalar_spy.assert_not_called()
 
-    def test_classify_hausdorff_suspect(self) -> None:
-        """Test classification Hausdorff pour SUSPECT."""
-        from pgboundary.geometry_compare import _classify_hausdorff_only
+    @pytest.mark.parametrize("method", list(SimilarityMethod), ids=lambda method: method.value)
+    def test_get_method_description(self, method: SimilarityMethod) -> None:
+        """Test de la description de chaque méthode."""
+        matcher = GeometryMatcher(method=method)
+        desc = matcher.get_method_description()
+        assert isinstance(desc, str)
+        assert len(desc) > 0
 
-        thresholds = SimilarityThresholds(hausdorff_max=10.0)
-        # <= 2x max = SUSPECT
-        assert _classify_hausdorff_only(15.0, thresholds) == SimilarityLevel.SUSPECT
 
-    def test_classify_hausdorff_distinct(self) -> None:
-        """Test classification Hausdorff pour DISTINCT."""
-        from pgboundary.geometry_compare import _classify_hausdorff_only
+class TestClassificationHelpers:
+    """Tests pour les fonctions de classification."""
 
-        thresholds = SimilarityThresholds(hausdorff_max=10.0)
-        # > 2x max = DISTINCT
-        assert _classify_hausdorff_only(25.0, thresholds) == SimilarityLevel.DISTINCT
+    @pytest.mark.parametrize(
+        ("iou", "expected"),
+        [
+            pytest.param(0.98, SimilarityLevel.IDENTICAL, id="identical"),
+            pytest.param(0.85, SimilarityLevel.LIKELY_MATCH, id="likely_match"),
+            pytest.param(0.60, SimilarityLevel.SUSPECT, id="suspect"),
+            pytest.param(0.30, SimilarityLevel.DISTINCT, id="distinct"),
+        ],
+    )
+    def test_classify_iou(self, iou: float, expected: SimilarityLevel) -> None:
+        """Test classification IoU selon les seuils par défaut."""
+        assert _classify_iou_only(iou, DEFAULT_THRESHOLDS) == expected
+
+    @pytest.mark.parametrize(
+        ("hausdorff", "expected"),
+        [
+            pytest.param(4.0, SimilarityLevel.IDENTICAL, id="identical"),  # <= 50% du max
+            pytest.param(8.0, SimilarityLevel.LIKELY_MATCH, id="likely_match"),  # <= max
+            pytest.param(15.0, SimilarityLevel.SUSPECT, id="suspect"),  # <= 2x max
+            pytest.param(25.0, SimilarityLevel.DISTINCT, id="distinct"),  # > 2x max
+        ],
+    )
+    def test_classify_hausdorff(self, hausdorff: float, expected: SimilarityLevel) -> None:
+        """Test classification Hausdorff (max = 10 m)."""
+        assert _classify_hausdorff_only(hausdorff, _HAUSDORFF_THRESHOLDS) == expected
@@ -7,9 +7,11 @@ de produits IGN avec support de l'historisation.
 from __future__ import annotations
 
 import pytest
+from pydantic import ValidationError
 
 from pgboundary.import_config import (
     DEFAULT_PRODUCT_CONFIGS,
+    DEFAULT_THRESHOLDS,
     HistorizationConfig,
     ImportsConfig,
     LayerImportConfig,
@@ -178,6 +180,12 @@ class TestSimilarityThresholds:
         with pytest.raises(ValueError):
             SimilarityThresholds(hausdorff_max=-1.0)
 
+    def test_default_thresholds_frozen(self) -> None:
+        """Test que les seuils par défaut partagés ne sont pas modifiables."""
+        assert SimilarityThresholds() == DEFAULT_THRESHOLDS
+        with pytest.raises(ValidationError, match="frozen"):
+            DEFAULT_THRESHOLDS.identical_min = 0.5  # type: ignore[misc]
+
 
 class TestHistorizationConfig:
     """Tests pour le modèle HistorizationConfig."""
@@ -217,7 +225,7 @@ class TestHistorizationConfig:
         """Test description pour MD5."""
         config = HistorizationConfig(method=SimilarityMethod.MD5)
         desc = config.get_threshold_description()
-        assert "MD5" in desc
+        assert "SHA-256" in desc
 
     def test_get_threshold_description_combined(self) -> None:
         """Test description pour COMBINED."""
@@ -0,0 +1,77 @@
+"""Tests communs à _get_enabled_layers_count de cli_config et cli_load.
+
+Les deux modules CLI exposent la même fonction : elles sont testées ici avec
+une seule matrice de cas pour garantir qu'elles restent synchronisées.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from pgboundary import cli_config, cli_load
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+LAYERS_COUNT_CASES = [
+    pytest.param({}, 0, 0, id="no_layers"),
+    pytest.param({"layers": {}}, 0, 0, id="empty_layers_dict"),
+    pytest.param(
+        {
+            "layers": {
+                "COMMUNE": {"enabled": True},
+                "REGION": {"enabled": True},
+                "DEPARTEMENT": {"enabled": True},
+            }
+        },
+        3,
+        3,
+        id="all_enabled",
+    ),
+    pytest.param(
+        {
+            "layers": {
+                "COMMUNE": {"enabled": True},
+                "REGION": {"enabled": False},
+                "DEPARTEMENT": {"enabled": True},
+            }
+        },
+        2,
+        3,
+        id="some_disabled",
+    ),
+    pytest.param(
+        {"layers": {"COMMUNE": {"enabled": False}, "REGION": {"enabled": False}}},
+        0,
+        2,
+        id="all_disabled",
+    ),
+    pytest.param(
+        {"layers": {"COMMUNE": {}, "REGION": {"table_name": "region"}}},
+        2,
+        2,
+        id="default_enabled_when_key_missing",
+    ),
+    pytest.param({"layers": ["COMMUNE", "REGION"]}, 2, 2, id="legacy_list_structure"),
+    pytest.param({"layers": []}, 0, 0, id="legacy_empty_list"),
+]
+
+
+@pytest.mark.parametrize(
+    "count_layers",
+    [
+        pytest.param(cli_config._get_enabled_layers_count, id="cli_config"),
+        pytest.param(cli_load._get_enabled_layers_count, id="cli_load"),
+    ],
+)
+@pytest.mark.parametrize(("config", "expected_enabled", "expected_total"), LAYERS_COUNT_CASES)
+def test_get_enabled_layers_count(
+    count_layers: Callable[[dict[str, Any]], tuple[int, int]],
+    config: dict[str, Any],
+    expected_enabled: int,
+    expected_total: int,
+) -> None:
+    """Test du décompte des couches activées et totales."""
+    assert count_layers(config) == (expected_enabled, expected_total)